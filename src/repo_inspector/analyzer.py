@@ -8,6 +8,7 @@ import asyncio
 import json
 import os
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -33,6 +34,7 @@ from repo_inspector.models import (
     ExtendedResult,
     FunctionalReport,
     InspectionResult,
+    MitigationAction,
     PeopleReport,
     ReviewCultureReport,
     SeverityLevel,
@@ -51,11 +53,15 @@ class Analyzer:
         token: Optional[str] = None,
         model: str = "gpt-4.1",
         on_status: Optional[Callable[[str], None]] = None,
+        fetcher: Optional[GitHubFetcher] = None,
     ) -> None:
         self.token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or None
         self.model = model
         self._on_status = on_status or (lambda _: None)
-        self._fetcher = GitHubFetcher(token=self.token)
+        # A fetcher passed in by the caller (e.g. the app's pre-warmed one)
+        # is borrowed: its lifetime belongs to the caller, not to close().
+        self._owns_fetcher = fetcher is None
+        self._fetcher = fetcher or GitHubFetcher(token=self.token)
         self._cloner = RepoCloner(token=self.token)
         self._copilot_client: object | None = None
         self._copilot_session: object | None = None
@@ -153,8 +159,9 @@ class Analyzer:
 
     async def close(self) -> None:
         """Tear down resources."""
-        await self._fetcher.close()
-        self._cloner.cleanup()
+        if self._owns_fetcher:
+            await self._fetcher.close()
+        await asyncio.to_thread(self._cloner.cleanup)
         if self._copilot_session:
             try:
                 await self._copilot_session.destroy()  # type: ignore[union-attr]
@@ -178,6 +185,7 @@ class Analyzer:
         """Run the entire inspection pipeline."""
         until = until or datetime.now(timezone.utc)
         timeframe = Timeframe(since=since, until=until)
+        await self._fetcher.restore_auth()
 
         # 1. Fetch GitHub data
         self._status("Fetching commits …")
@@ -202,13 +210,15 @@ class Analyzer:
             except Exception:
                 pass
 
-        # 2. Clone repo
+        # 2. Clone repo (blocking git/filesystem work runs off the event loop)
         self._status("Cloning repository …")
-        self._cloner.clone(owner, repo)
+        await asyncio.to_thread(self._cloner.clone, owner, repo)
 
         # 3. People analysis
         self._status("Analyzing contributors …")
-        contributor_stats = compute_contributor_stats(commits, prs, issues)
+        contributor_stats = await asyncio.to_thread(
+            compute_contributor_stats, commits, prs, issues
+        )
         bus_factor = compute_bus_factor(contributor_stats)
         contributor_insights = await self._analyze_people_llm(
             owner, repo, contributor_stats, timeframe
@@ -232,8 +242,8 @@ class Analyzer:
         self._status("Analyzing functional areas …")
         readme = await self._fetcher.fetch_readme(owner, repo) or ""
         repo_info = await self._fetcher.fetch_repo_info(owner, repo)
-        areas = build_functional_areas(self._cloner)
-        tree = self._cloner.get_tree_summary(max_depth=2)
+        areas = await asyncio.to_thread(build_functional_areas, self._cloner)
+        tree = await asyncio.to_thread(self._cloner.get_tree_summary, max_depth=2)
 
         functional_report = await self._analyze_functional_llm(
             owner, repo, readme, repo_info, areas, tree
@@ -241,7 +251,7 @@ class Analyzer:
 
         # 5. Code / Security analysis
         self._status("Analyzing code quality & security …")
-        folder_analyses = build_folder_analyses(self._cloner)
+        folder_analyses = await asyncio.to_thread(build_folder_analyses, self._cloner)
         code_report = await self._analyze_code_llm(owner, repo, folder_analyses)
 
         self._status("Done!")
@@ -284,8 +294,10 @@ class Analyzer:
 
         # Knowledge Map
         self._status("Building knowledge map …")
-        top_dirs = self._cloner.list_top_level_dirs()
-        km = build_knowledge_map(result.people.stats, result.commits, top_dirs)
+        top_dirs = await asyncio.to_thread(self._cloner.list_top_level_dirs)
+        km = await asyncio.to_thread(
+            build_knowledge_map, result.people.stats, result.commits, top_dirs
+        )
         if km.knowledge_silos:
             silos_text = "\n".join(f"- {s}" for s in km.knowledge_silos)
             km.pairing_suggestions = await self._ask_llm_list(
@@ -304,7 +316,7 @@ class Analyzer:
 
         # Dependency Scanner
         self._status("Scanning dependencies …")
-        dep_report = build_dependency_report(self._cloner)
+        dep_report = await asyncio.to_thread(build_dependency_report, self._cloner)
         if dep_report.dependencies:
             dep_report = await self._analyze_dependencies_llm(
                 owner, repo, dep_report
@@ -331,8 +343,10 @@ class Analyzer:
 
         # Changelog
         self._status("Generating changelog …")
-        changelog = build_changelog(result.commits, result.pull_requests)
-        render_changelog_markdown(changelog)
+        changelog = await asyncio.to_thread(
+            build_changelog, result.commits, result.pull_requests
+        )
+        await asyncio.to_thread(render_changelog_markdown, changelog)
         changelog.llm_summary = await self._ask_llm(
             f"Summarize this changelog for {owner}/{repo} in 2 sentences. "
             f"There are {len(changelog.entries)} entries."
@@ -353,7 +367,8 @@ class Analyzer:
 
         # What-If Simulator
         self._status("Running what-if simulations …")
-        what_if = build_what_if_report(
+        what_if = await asyncio.to_thread(
+            build_what_if_report,
             result.people.stats, result.commits,
             result.pull_requests, result.issues,
             result.people.bus_factor, top_dirs,
@@ -502,7 +517,9 @@ class Analyzer:
                 continue
             self._status(f"Analyzing {fa.path}/ …")
 
-            code_samples = gather_code_samples(self._cloner, fa.path)
+            code_samples = await asyncio.to_thread(
+                gather_code_samples, self._cloner, fa.path
+            )
             if not code_samples.strip():
                 continue
 
@@ -646,7 +663,7 @@ class Analyzer:
             except Exception:
                 pass
 
-        report = build_review_culture(prs, reviews_by_pr)
+        report = await asyncio.to_thread(build_review_culture, prs, reviews_by_pr)
 
         if report.reviewers:
             reviewers_text = "\n".join(
@@ -689,7 +706,8 @@ class Analyzer:
             except Exception:
                 pass
 
-        report = build_stale_branch_report(
+        report = await asyncio.to_thread(
+            build_stale_branch_report,
             branches, default_branch, compare_data
         )
 
@@ -715,7 +733,7 @@ class Analyzer:
         monopolists_text = ", ".join(f"@{m}" for m in report.knowledge_monopolists)
         exclusive_text = "\n".join(
             f"- @{login}: {len(files)} exclusive files (e.g. {', '.join(files[:3])})"
-            for login, files in list(report.exclusive_files.items())[:5]
+            for login, files in islice(report.exclusive_files.items(), 5)
         )
 
         prompt = (
@@ -737,7 +755,6 @@ class Analyzer:
             if text.endswith("```"):
                 text = text[:-3]
         try:
-            from repo_inspector.models import MitigationAction
             data = json.loads(text)
             report.actions = [
                 MitigationAction(**a) for a in data.get("actions", [])
@@ -819,7 +836,9 @@ class Analyzer:
                 llm_summary="Could not fetch historical data for comparison.",
             )
 
-        old_stats = compute_contributor_stats(old_commits, old_prs, old_issues)
+        old_stats = await asyncio.to_thread(
+            compute_contributor_stats, old_commits, old_prs, old_issues
+        )
         old_bus = compute_bus_factor(old_stats)
 
         report = build_time_comparison(
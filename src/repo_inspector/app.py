@@ -1,12 +1,13 @@
 """Main Textual TUI application for repo-inspector."""
 
-import asyncio
-from datetime import datetime, timezone
+import os
+from datetime import datetime
 
 import httpx
 from textual.app import App
 
 from repo_inspector.analyzer import Analyzer
+from repo_inspector.fetcher import GitHubFetcher
 from repo_inspector.models import InspectionResult
 from repo_inspector.screens.home import HomeScreen
 from repo_inspector.screens.loading import LoadingScreen
@@ -34,8 +35,24 @@ class RepoInspectorApp(App):
     ]
 
     def on_mount(self) -> None:
+        self.fetcher = GitHubFetcher(
+            token=os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or None
+        )
+        # Establish the GitHub connection while the user fills in the form,
+        # so the first real request doesn't pay for the TLS handshake.
+        self.run_worker(self._warm_up_fetcher(), exit_on_error=False)
         self.push_screen(HomeScreen())
 
+    async def on_unmount(self) -> None:
+        await self.fetcher.close()
+
+    async def _warm_up_fetcher(self) -> None:
+        # Best effort — the inspection itself will surface real errors.
+        try:
+            await self.fetcher.fetch_rate_limit()
+        except httpx.HTTPError:
+            self.log.warning("GitHub warm-up request failed; continuing without it")
+
     def run_inspection(
         self, owner: str, repo: str, since: datetime
     ) -> None:
@@ -50,22 +67,22 @@ class RepoInspectorApp(App):
             def on_status(msg: str) -> None:
                 status_counter["n"] += 1
                 pct = min(int(status_counter["n"] / total_steps * 100), 95)
-                self.call_from_thread(loading.update_status, msg, pct)
+                loading.update_status(msg, pct)
 
-            analyzer = Analyzer(on_status=on_status)
+            # Runs on the app's event loop so the pre-warmed fetcher (whose
+            # connections are bound to this loop) can be reused.
+            analyzer = Analyzer(on_status=on_status, fetcher=self.fetcher)
             try:
                 result = await analyzer.inspect(owner, repo, since)
-                self.call_from_thread(loading.update_status, "Complete!", 100)
-                self.call_from_thread(self._show_results, result)
+                loading.update_status("Complete!", 100)
+                self._show_results(result)
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
-                    self.call_from_thread(
-                        loading.update_status,
+                    loading.update_status(
                         f"❌ Repository '{owner}/{repo}' not found. Check the owner/repo name and try again.",
                         None,
                     )
                 elif e.response.status_code == 403:
-                    import os
                     resp_text = getattr(e.response, "text", "")
                     has_token = bool(
                         os.environ.get("GITHUB_TOKEN")
@@ -105,40 +122,32 @@ class RepoInspectorApp(App):
                             "export GITHUB_TOKEN=ghp_… "
                             "(or: export GITHUB_TOKEN=$(gh auth token))"
                         )
-                    self.call_from_thread(
-                        loading.update_status, msg, None,
-                    )
+                    loading.update_status(msg, None)
                 elif e.response.status_code == 401:
-                    self.call_from_thread(
-                        loading.update_status,
+                    loading.update_status(
                         "❌ Authentication failed. Please check your GitHub token.",
                         None,
                     )
                 else:
-                    self.call_from_thread(
-                        loading.update_status,
+                    loading.update_status(
                         f"❌ GitHub API error ({e.response.status_code}): {e.response.reason_phrase}",
                         None,
                     )
-                self.call_from_thread(self._show_error_back_button)
+                self._show_error_back_button()
             except httpx.ConnectError:
-                self.call_from_thread(
-                    loading.update_status,
+                loading.update_status(
                     "❌ Could not connect to GitHub. Check your internet connection.",
                     None,
                 )
-                self.call_from_thread(self._show_error_back_button)
+                self._show_error_back_button()
             except Exception as e:
-                self.call_from_thread(
-                    loading.update_status,
-                    f"❌ Unexpected error: {e}",
-                    None,
-                )
-                self.call_from_thread(self._show_error_back_button)
+                loading.update_status(f"❌ Unexpected error: {e}", None)
+                self._show_error_back_button()
             finally:
                 await analyzer.close()
 
-        self.run_worker(_do_work(), thread=True)
+        # One inspection at a time: they all share self.fetcher.
+        self.run_worker(_do_work(), group="inspection", exclusive=True)
 
     def _show_results(self, result: InspectionResult) -> None:
         """Replace loading screen with results."""
@@ -1,12 +1,21 @@
 """GitHub data fetching via REST API."""
 
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 
 import httpx
 
 from repo_inspector.models import Commit, Issue, PullRequest
 
+_get_name = itemgetter("name")
+
+
+def _label_names(item: dict) -> list[str]:
+    """Extract label names from a raw PR/issue payload."""
+    labels = item.get("labels")
+    return list(map(_get_name, labels)) if labels else []
+
 
 class GitHubFetcher:
     """Fetches commits, PRs, and issues from the GitHub REST API."""
@@ -14,8 +23,10 @@ class GitHubFetcher:
     def __init__(self, token: Optional[str] = None) -> None:
         self.token = token
         self.base_url = "https://api.github.com"
-        self._client: Optional[httpx.AsyncClient] = None
         self._saml_fallback = False  # True if we dropped auth due to SAML
+        # Built eagerly so callers can warm the connection (see
+        # fetch_rate_limit) before the first real request is issued.
+        self._client: Optional[httpx.AsyncClient] = self._build_client()
 
     # ── HTTP plumbing ─────────────────────────────────────────────────────
 
@@ -29,13 +40,16 @@ class GitHubFetcher:
             h["Authorization"] = f"Bearer {self.token}"
         return h
 
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+        )
+
     async def _client_instance(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=self.headers,
-                timeout=30.0,
-            )
+            self._client = self._build_client()
         return self._client
 
     async def _rebuild_client_without_auth(self) -> None:
@@ -74,6 +88,19 @@ class GitHubFetcher:
             )
         return resp
 
+    async def restore_auth(self) -> None:
+        """Undo a SAML fallback so the next request is authenticated again.
+
+        A fetcher shared across inspections must not carry one org's SAML
+        fallback over to the next repository.
+        """
+        if not self._saml_fallback:
+            return
+        self._saml_fallback = False
+        if self._client:
+            await self._client.aclose()
+        self._client = self._build_client()
+
     @property
     def is_unauthenticated(self) -> bool:
         """True if we fell back to no-auth (SAML) mode."""
@@ -109,6 +136,19 @@ class GitHubFetcher:
                 break
         return results
 
+    # ── Rate limit ────────────────────────────────────────────────────────
+
+    async def fetch_rate_limit(self) -> dict:
+        """Fetch the current rate-limit status.
+
+        The endpoint does not count against the quota, which makes it a cheap
+        probe for establishing the TLS connection ahead of the real work.
+        """
+        resp = await self._get("/rate_limit")
+        resp.raise_for_status()
+        data: dict = resp.json()
+        return data
+
     # ── Commits ───────────────────────────────────────────────────────────
 
     async def fetch_commits(
@@ -207,7 +247,7 @@ class GitHubFetcher:
                     merged_at=merged_at,
                     closed_at=closed_at,
                     url=item["html_url"],
-                    labels=[l["name"] for l in item.get("labels", [])],
+                    labels=_label_names(item),
                     additions=item.get("additions", 0),
                     deletions=item.get("deletions", 0),
                     changed_files=item.get("changed_files", 0),
@@ -255,7 +295,7 @@ class GitHubFetcher:
                     ),
                     closed_at=closed_at,
                     url=item["html_url"],
-                    labels=[l["name"] for l in item.get("labels", [])],
+                    labels=_label_names(item),
                 )
             )
         return issues
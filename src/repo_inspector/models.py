@@ -1,10 +1,11 @@
 """Data models for repo-inspector."""
 
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 # ── Timeframe ──────────────────────────────────────────────────────────────
@@ -115,6 +116,12 @@ class PeopleReport(BaseModel):
     bus_factor: int = 0
     llm_summary: str = ""
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_commits(self) -> int:
+        """Commits across all contributors."""
+        return sum(s.commit_count for s in self.stats)
+
 
 # ── Functional analysis ──────────────────────────────────────────────────
 
@@ -150,6 +157,15 @@ class SeverityLevel(str, Enum):
     info = "info"
 
 
+_SEVERITY_ICONS: dict[SeverityLevel, str] = {
+    SeverityLevel.critical: "🔴",
+    SeverityLevel.high: "🟠",
+    SeverityLevel.medium: "🟡",
+    SeverityLevel.low: "🔵",
+    SeverityLevel.info: "⚪",
+}
+
+
 class CodeFinding(BaseModel):
     """A single code quality or security finding."""
 
@@ -165,14 +181,7 @@ class CodeFinding(BaseModel):
 
     @property
     def display_severity(self) -> str:
-        icons = {
-            SeverityLevel.critical: "🔴",
-            SeverityLevel.high: "🟠",
-            SeverityLevel.medium: "🟡",
-            SeverityLevel.low: "🔵",
-            SeverityLevel.info: "⚪",
-        }
-        return f"{icons[self.severity]} {self.severity.value.upper()}"
+        return f"{_SEVERITY_ICONS[self.severity]} {self.severity.value.upper()}"
 
 
 class FolderAnalysis(BaseModel):
@@ -187,10 +196,7 @@ class FolderAnalysis(BaseModel):
 
     @property
     def finding_count_by_severity(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for f in self.findings:
-            counts[f.severity.value] = counts.get(f.severity.value, 0) + 1
-        return counts
+        return dict(Counter(f.severity.value for f in self.findings))
 
 
 class CodeReport(BaseModel):
@@ -203,26 +209,6 @@ class CodeReport(BaseModel):
     llm_summary: str = ""
 
 
-# ── Full inspection result ────────────────────────────────────────────────
-
-class InspectionResult(BaseModel):
-    """Complete result of a repo inspection."""
-
-    repo: str
-    timeframe: Timeframe
-    generated_at: datetime = Field(default_factory=datetime.now)
-    people: PeopleReport = Field(default_factory=PeopleReport)
-    functional: FunctionalReport = Field(default_factory=FunctionalReport)
-    code: CodeReport = Field(default_factory=CodeReport)
-
-    # Raw data (kept for extended analyses)
-    commits: list[Commit] = Field(default_factory=list)
-    pull_requests: list[PullRequest] = Field(default_factory=list)
-    issues: list[Issue] = Field(default_factory=list)
-
-    # Extended analysis results (populated after core inspection)
-    extended: Optional["ExtendedResult"] = None
-
 class TimeComparisonDelta(BaseModel):
     """Delta between two timeframes for a single metric."""
 
@@ -421,5 +407,22 @@ class ExtendedResult(BaseModel):
     what_if: Optional[WhatIfReport] = None
 
 
-# Resolve forward reference for InspectionResult.extended
-InspectionResult.model_rebuild()
+# ── Full inspection result ────────────────────────────────────────────────
+
+class InspectionResult(BaseModel):
+    """Complete result of a repo inspection."""
+
+    repo: str
+    timeframe: Timeframe
+    generated_at: datetime = Field(default_factory=datetime.now)
+    people: PeopleReport = Field(default_factory=PeopleReport)
+    functional: FunctionalReport = Field(default_factory=FunctionalReport)
+    code: CodeReport = Field(default_factory=CodeReport)
+
+    # Raw data (kept for extended analyses)
+    commits: list[Commit] = Field(default_factory=list)
+    pull_requests: list[PullRequest] = Field(default_factory=list)
+    issues: list[Issue] = Field(default_factory=list)
+
+    # Extended analysis results (populated after core inspection)
+    extended: Optional[ExtendedResult] = None
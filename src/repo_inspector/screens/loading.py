@@ -42,6 +42,13 @@ class LoadingScreen(Screen):
     }
     """
 
+    FLUSH_INTERVAL = 0.05  # seconds between status repaints
+
+    def __init__(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(**kwargs)
+        self._queued_message: str | None = None
+        self._queued_progress: int | None = None
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         with Center():
@@ -52,14 +59,28 @@ class LoadingScreen(Screen):
                 yield Label("", id="phase-label")
         yield Footer()
 
+    def on_mount(self) -> None:
+        self._status_label = self.query_one("#status-label", Label)
+        self._progress_bar = self.query_one("#progress-bar", ProgressBar)
+        self.set_interval(self.FLUSH_INTERVAL, self._flush_status)
+
     def update_status(self, message: str, progress: int | None = None) -> None:
-        """Update the status message and optionally the progress bar."""
-        try:
-            self.query_one("#status-label", Label).update(message)
-            if progress is not None:
-                self.query_one("#progress-bar", ProgressBar).update(progress=progress)
-        except Exception:
-            pass
+        """Queue a status message and optionally a progress value.
+
+        Updates are coalesced: only the latest message (and latest progress)
+        is painted on the next flush tick.
+        """
+        self._queued_message = message
+        if progress is not None:
+            self._queued_progress = progress
+
+    def _flush_status(self) -> None:
+        if self._queued_message is not None:
+            self._status_label.update(self._queued_message)
+            self._queued_message = None
+        if self._queued_progress is not None:
+            self._progress_bar.update(progress=self._queued_progress)
+            self._queued_progress = None
 
     def set_phase(self, phase: str) -> None:
         try:
@@ -1,9 +1,17 @@
 """Results screen — tabbed view with People / Functional / Code tabs + extended analysis."""
 
+import asyncio
+from collections.abc import Callable
+from functools import lru_cache
+from itertools import islice
+from typing import Any
+
+from textual import on
 from textual.app import ComposeResult
-from textual.containers import Vertical, VerticalScroll
+from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import (
+    Button,
     DataTable,
     Footer,
     Header,
@@ -14,7 +22,190 @@ from textual.widgets import (
     TabPane,
 )
 
-from repo_inspector.models import InspectionResult
+from repo_inspector.models import (
+    ContributorStats,
+    DependencyInfo,
+    InspectionResult,
+    ReviewerStats,
+    StaleBranch,
+)
+
+_BRANCH_CATEGORY_ICONS = {
+    "orphan": "👻", "wip": "🚧", "stale-feature": "🏚",
+    "stale-fix": "🩹", "abandoned": "💀",
+}
+
+_RISK_ICONS = {
+    "critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢",
+}
+
+
+# Visual heat bars using block chars, indexed by filled length (0–5).
+_HEAT_BARS = tuple("█" * n + "░" * (5 - n) for n in range(6))
+_EMPTY_HEAT_CELL = _HEAT_BARS[0] + " 0"
+
+
+def _people_row(s: ContributorStats) -> tuple[str, ...]:
+    return (
+        "@" + s.login,
+        str(s.commit_count),
+        f"+{s.lines_added}",
+        f"-{s.lines_removed}",
+        f"{s.prs_opened} ({s.prs_merged})",
+        ", ".join(s.top_directories[:3]),
+    )
+
+
+def _reviewer_row(r: ReviewerStats, bottlenecks: set[str]) -> tuple[str, ...]:
+    return (
+        "@" + r.login + (" 🔴" if r.login in bottlenecks else ""),
+        str(r.reviews_given),
+        f"{r.avg_review_time_hours:.1f}",
+        str(r.approvals),
+        str(r.rejections),
+        ", ".join(["@" + a for a in r.reviewed_authors[:3]]),
+    )
+
+
+def _dependency_row(d: DependencyInfo) -> tuple[str, ...]:
+    risk_icon = "⚠️" if d.risk_notes else "✅"
+    return (
+        d.name,
+        d.version or "—",
+        d.ecosystem,
+        d.source_file,
+        f"{risk_icon} {d.risk_notes}" if d.risk_notes else risk_icon,
+    )
+
+
+def _stale_branch_row(b: StaleBranch) -> tuple[str, ...]:
+    icon = _BRANCH_CATEGORY_ICONS.get(b.category, "❓")
+    return (
+        b.name,
+        str(b.days_stale),
+        b.author or "—",
+        f"{icon} {b.category}",
+        b.ahead_behind,
+    )
+
+
+def _has_extended(result: InspectionResult, attr: str) -> bool:
+    return result.extended is not None and getattr(result.extended, attr) is not None
+
+
+# ── Card markdown ─────────────────────────────────────────────────────────
+# Models are unhashable, so the builders take plain field values; the cache
+# lets revisited tabs and re-pushed screens reuse the assembled text.
+
+
+@lru_cache(maxsize=512)
+def _insight_md(login: str, role: str, summary: str, judgment: str, risk_notes: str) -> str:
+    md = (
+        f"**@{login}** — _{role}_\n\n"
+        f"{summary}\n\n"
+        f"**Assessment:** {judgment}"
+    )
+    if risk_notes:
+        md += f"\n\n⚠️ **Risk:** {risk_notes}"
+    return md
+
+
+@lru_cache(maxsize=512)
+def _area_md(name: str, description: str, key_files: tuple[str, ...], improvement_notes: str) -> str:
+    parts = [f"### {name}/\n\n{description}"]
+    if key_files:
+        parts.append("\n\n**Key files:** " + ", ".join([f"`{kf}`" for kf in key_files]))
+    if improvement_notes:
+        parts.append(f"\n\n💡 **Improvements:** {improvement_notes}")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=512)
+def _finding_md(
+    severity: str, title: str, category: str, file: str, description: str, suggestion: str
+) -> str:
+    md = f"{severity}  **{title}**\n\nCategory: `{category}`"
+    if file:
+        md += f" · File: `{file}`"
+    md += f"\n\n{description}"
+    if suggestion:
+        md += f"\n\n✅ **Fix:** {suggestion}"
+    return md
+
+
+@lru_cache(maxsize=512)
+def _action_md(priority: int, action: str, contributor: str, area: str, rationale: str) -> str:
+    return (
+        f"**Priority {priority}:** {action}\n\n"
+        f"Target: @{contributor} · `{area}`\n\n"
+        f"_{rationale}_"
+    )
+
+
+@lru_cache(maxsize=512)
+def _scenario_md(
+    scenario: str,
+    parameter: str,
+    bus_factor_before: int,
+    bus_factor_after: int,
+    orphaned_files: tuple[str, ...],
+    affected_areas: tuple[str, ...],
+    impact_summary: str,
+) -> str:
+    if scenario == "remove_contributor":
+        title = f"🚪 What if @{parameter} leaves?"
+        bus_text = f"Bus Factor: {bus_factor_before} → {bus_factor_after}"
+        delta = bus_factor_after - bus_factor_before
+        trend = "📉" if delta < 0 else ("📊" if delta == 0 else "📈")
+    elif scenario == "deprecate_module":
+        title = f"🗑 What if `{parameter}/` is deprecated?"
+        bus_text = ""
+        trend = "📊"
+    else:
+        title = f"❓ {scenario}: {parameter}"
+        bus_text = ""
+        trend = "📊"
+
+    parts = [f"### {title}\n\n"]
+    if bus_text:
+        parts.append(f"{trend} {bus_text}\n\n")
+    n_orphaned = len(orphaned_files)
+    if n_orphaned:
+        parts.append(f"**Orphaned files:** {n_orphaned}\n")
+        parts.extend([f"- `{f}`\n" for f in orphaned_files[:5]])
+        if n_orphaned > 5:
+            parts.append(f"- ... and {n_orphaned - 5} more\n")
+    if affected_areas:
+        parts.append(f"\n**Affected areas:** {', '.join(affected_areas)}\n")
+    if impact_summary:
+        parts.append(f"\n💡 _{impact_summary}_")
+    return "".join(parts)
+
+
+def _empty_note(msg: str) -> Static:
+    """Placeholder for a tab with no data — plain Rich markup, no markdown parse."""
+    return Static(f"[italic]{msg}[/italic]", classes="empty-note")
+
+
+class _TabBody(Container):
+    """Container whose children come from one of ResultsScreen's ``_compose_*`` methods.
+
+    *on_ready* runs once those children are mounted, e.g. to start the
+    workers that stream the rest of a table in.
+    """
+
+    def __init__(
+        self, compose_tab: Callable[[], ComposeResult], on_ready: Callable[[], None]
+    ) -> None:
+        super().__init__()
+        self._compose_tab = compose_tab
+        self._on_ready = on_ready
+
+    def compose(self) -> ComposeResult:
+        yield from self._compose_tab()
+
+    def on_mount(self) -> None:
+        self._on_ready()
 
 
 class ResultsScreen(Screen):
@@ -67,6 +258,15 @@ class ResultsScreen(Screen):
     .finding-card.security {
         border: round $error;
     }
+    .empty-note {
+        margin: 1 0;
+        padding: 0 1;
+        border-left: outer $primary;
+        color: $text-muted;
+    }
+    .load-more {
+        margin: 0 0 1 0;
+    }
     #back-btn {
         dock: bottom;
         margin: 1 2;
@@ -78,10 +278,34 @@ class ResultsScreen(Screen):
         ("b", "go_back", "Back"),
     ]
 
+    # Rows per page (initial view and each "Load more") in unbounded tables.
+    VISIBLE_ROWS = 50
+    # Rows added synchronously on first paint; the rest of the page streams in.
+    FIRST_PAINT_ROWS = 20
+    STREAM_CHUNK = 10
+
+    # (title, pane id, shown?) — each pane is filled by ``_compose_<id>`` on
+    # first view; extended tabs are left out when their report was not built.
+    TABS: list[tuple[str, str, Callable[[InspectionResult], bool]]] = [
+        ("👥 People", "people", lambda _: True),
+        ("🏗 Functional", "functional", lambda _: True),
+        ("🔒 Code & Security", "code", lambda _: True),
+        ("⏰ Time Machine", "time_machine", lambda r: _has_extended(r, "time_machine")),
+        ("🗺 Knowledge Map", "knowledge_map", lambda r: _has_extended(r, "knowledge_map")),
+        ("📦 Dependencies", "dependencies", lambda r: _has_extended(r, "dependencies")),
+        ("👀 Reviews", "reviews", lambda r: _has_extended(r, "review_culture")),
+        ("🪦 Stale Branches", "stale_branches", lambda r: _has_extended(r, "stale_branches")),
+        ("📝 Changelog", "changelog", lambda r: _has_extended(r, "changelog")),
+        ("🚌 Bus Factor", "bus_factor", lambda r: _has_extended(r, "bus_mitigation")),
+        ("🔮 What-If", "what_if", lambda r: _has_extended(r, "what_if")),
+    ]
+
     def __init__(self, result: InspectionResult, **kwargs) -> None:  # type: ignore[no-untyped-def]
         super().__init__(**kwargs)
         self.result = result
-
+        self._composed: set[str] = set()
+        # Tables queued by a ``_compose_*`` method, streamed once mounted.
+        self._pending_streams: list[tuple[DataTable, list, Callable, Button]] = []
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -90,37 +314,36 @@ class ResultsScreen(Screen):
             id="results-header",
         )
 
-        with TabbedContent(
-            "👥 People", "🏗 Functional", "🔒 Code & Security",
-            "⏰ Time Machine", "🗺 Knowledge Map", "📦 Dependencies",
-            "👀 Reviews", "🪦 Stale Branches", "📝 Changelog",
-            "🚌 Bus Factor", "🔮 What-If",
-        ):
-            with TabPane("👥 People"):
-                yield from self._compose_people()
-            with TabPane("🏗 Functional"):
-                yield from self._compose_functional()
-            with TabPane("🔒 Code & Security"):
-                yield from self._compose_code()
-            with TabPane("⏰ Time Machine"):
-                yield from self._compose_time_machine()
-            with TabPane("🗺 Knowledge Map"):
-                yield from self._compose_knowledge_map()
-            with TabPane("📦 Dependencies"):
-                yield from self._compose_dependencies()
-            with TabPane("👀 Reviews"):
-                yield from self._compose_reviews()
-            with TabPane("🪦 Stale Branches"):
-                yield from self._compose_stale_branches()
-            with TabPane("📝 Changelog"):
-                yield from self._compose_changelog()
-            with TabPane("🚌 Bus Factor"):
-                yield from self._compose_bus_factor()
-            with TabPane("🔮 What-If"):
-                yield from self._compose_what_if()
+        with TabbedContent():
+            for title, tab_id, shown in self.TABS:
+                if not shown(self.result):
+                    continue
+                with TabPane(title, id=tab_id):
+                    yield Static("Loading…")
 
         yield Footer()
 
+    @on(TabbedContent.TabActivated)
+    async def _build_active_tab(self, event: TabbedContent.TabActivated) -> None:
+        """Build a tab's widgets the first time it is shown.
+
+        TabbedContent only hides inactive panes, so the widgets (and their
+        parsed markdown) survive tab switches; re-activation is a no-op.
+        """
+        tab_id = event.pane.id
+        if tab_id is None or tab_id in self._composed:
+            return
+        self._composed.add(tab_id)
+        await event.pane.remove_children()
+        await event.pane.mount(
+            _TabBody(getattr(self, f"_compose_{tab_id}"), self._start_pending_streams)
+        )
+
+    def _extended(self, attr: str) -> Any:
+        """Return one extended report, or None when extended analysis was skipped."""
+        ext = self.result.extended
+        return getattr(ext, attr) if ext else None
+
     # ── People tab ────────────────────────────────────────────────────────
 
     def _compose_people(self) -> ComposeResult:
@@ -130,7 +353,7 @@ class ResultsScreen(Screen):
             yield Label(
                 f"Contributors: {p.total_contributors}  ·  "
                 f"Bus Factor: {p.bus_factor}  ·  "
-                f"Commits: {sum(s.commit_count for s in p.stats)}"
+                f"Commits: {p.total_commits}"
             )
 
             if p.llm_summary:
@@ -142,15 +365,7 @@ class ResultsScreen(Screen):
                 "Contributor", "Commits", "+Lines", "-Lines",
                 "PRs (merged)", "Top Dirs",
             )
-            for s in p.stats[:15]:
-                table.add_row(
-                    f"@{s.login}",
-                    str(s.commit_count),
-                    f"+{s.lines_added}",
-                    f"-{s.lines_removed}",
-                    f"{s.prs_opened} ({s.prs_merged})",
-                    ", ".join(s.top_directories[:3]),
-                )
+            table.add_rows(map(_people_row, p.stats[:15]))
             yield table
 
             if p.insights:
@@ -159,13 +374,10 @@ class ResultsScreen(Screen):
                     if ins.login == "(parse error)":
                         yield Label(f"⚠ {ins.activity_summary}")
                         continue
-                    md = (
-                        f"**@{ins.login}** — _{ins.inferred_role}_\n\n"
-                        f"{ins.activity_summary}\n\n"
-                        f"**Assessment:** {ins.judgment}"
+                    md = _insight_md(
+                        ins.login, ins.inferred_role, ins.activity_summary,
+                        ins.judgment, ins.risk_notes,
                     )
-                    if ins.risk_notes:
-                        md += f"\n\n⚠️ **Risk:** {ins.risk_notes}"
                     with Vertical(classes="insight-card"):
                         yield Markdown(md)
 
@@ -200,13 +412,10 @@ class ResultsScreen(Screen):
             if f.areas:
                 yield Static("FUNCTIONAL AREAS", classes="section-title")
                 for area in f.areas:
-                    content = f"### {area.name}/\n\n{area.description}"
-                    if area.key_files:
-                        content += "\n\n**Key files:** " + ", ".join(
-                            f"`{kf}`" for kf in area.key_files[:8]
-                        )
-                    if area.improvement_notes:
-                        content += f"\n\n💡 **Improvements:** {area.improvement_notes}"
+                    content = _area_md(
+                        area.name, area.description,
+                        tuple(area.key_files[:8]), area.improvement_notes,
+                    )
                     with Vertical(classes="insight-card"):
                         yield Markdown(content)
 
@@ -239,11 +448,8 @@ class ResultsScreen(Screen):
             if c.llm_summary:
                 yield Markdown(f"> {c.llm_summary}")
 
-            has_folder_content = False
-            for fa in c.folders:
-                if not fa.findings and not fa.llm_notes:
-                    continue
-                has_folder_content = True
+            folders = [fa for fa in c.folders if fa.findings or fa.llm_notes]
+            for fa in folders:
                 yield Static(
                     f"📁  {fa.path}/  ({fa.file_count} files, {fa.total_lines} lines)",
                     classes="section-title",
@@ -253,19 +459,14 @@ class ResultsScreen(Screen):
 
                 for finding in fa.findings:
                     css_class = "finding-card security" if finding.category == "security" else "finding-card"
-                    md = (
-                        f"{finding.display_severity}  **{finding.title}**\n\n"
-                        f"Category: `{finding.category}`"
+                    md = _finding_md(
+                        finding.display_severity, finding.title, finding.category,
+                        finding.file, finding.description, finding.suggestion,
                     )
-                    if finding.file:
-                        md += f" · File: `{finding.file}`"
-                    md += f"\n\n{finding.description}"
-                    if finding.suggestion:
-                        md += f"\n\n✅ **Fix:** {finding.suggestion}"
                     with Vertical(classes=css_class):
                         yield Markdown(md)
 
-            if not has_folder_content:
+            if not folders:
                 yield Markdown(
                     "\n\n_No specific folder-level findings were identified._"
                 )
@@ -273,14 +474,9 @@ class ResultsScreen(Screen):
     # ── Time Machine tab ──────────────────────────────────────────────────
 
     def _compose_time_machine(self) -> ComposeResult:
-        ext = self.result.extended
-        tm = ext.time_machine if ext else None
+        tm = self._extended("time_machine")
         with VerticalScroll():
             yield Static("TIME MACHINE — HISTORICAL COMPARISON", classes="section-title")
-            if not tm:
-                yield Markdown("> _No time machine data available._")
-                return
-
             yield Label(
                 f"Comparing: {tm.old_timeframe.label}  vs  {tm.new_timeframe.label}"
             )
@@ -311,12 +507,11 @@ class ResultsScreen(Screen):
     # ── Knowledge Map tab ─────────────────────────────────────────────────
 
     def _compose_knowledge_map(self) -> ComposeResult:
-        ext = self.result.extended
-        km = ext.knowledge_map if ext else None
+        km = self._extended("knowledge_map")
         with VerticalScroll():
             yield Static("KNOWLEDGE MAP — WHO KNOWS WHAT", classes="section-title")
             if not km or not km.contributors:
-                yield Markdown("> _No knowledge map data available._")
+                yield _empty_note("No knowledge map data available.")
                 return
 
             if km.llm_summary:
@@ -326,23 +521,22 @@ class ResultsScreen(Screen):
             yield Static("CONTRIBUTOR × FOLDER HEATMAP", classes="section-title")
             table = DataTable()
             table.add_column("Contributor", width=16)
-            for folder in km.folders[:10]:
+            visible_folders = km.folders[:10]
+            for folder in visible_folders:
                 table.add_column(folder, width=max(len(folder), 8))
+            cell_index = {(c.login, c.folder): c for c in km.cells}
+            rows = []
             for login in km.contributors[:15]:
-                row_values = [f"@{login}"]
-                for folder in km.folders[:10]:
-                    cell = next(
-                        (c for c in km.cells if c.login == login and c.folder == folder),
-                        None
+                row_values = ["@" + login]
+                for folder in visible_folders:
+                    cell = cell_index.get((login, folder))
+                    row_values.append(
+                        f"{_HEAT_BARS[min(5, max(1, int(cell.score * 5)))]} {cell.commits}"
+                        if cell and cell.commits > 0
+                        else _EMPTY_HEAT_CELL
                     )
-                    if cell and cell.commits > 0:
-                        # Visual bar using block chars
-                        bar_len = max(1, int(cell.score * 5))
-                        bar = "█" * bar_len + "░" * (5 - bar_len)
-                        row_values.append(f"{bar} {cell.commits}")
-                    else:
-                        row_values.append("░░░░░ 0")
-                table.add_row(*row_values)
+                rows.append(row_values)
+            table.add_rows(rows)
             yield table
 
             if km.knowledge_silos:
@@ -358,12 +552,11 @@ class ResultsScreen(Screen):
     # ── Dependencies tab ──────────────────────────────────────────────────
 
     def _compose_dependencies(self) -> ComposeResult:
-        ext = self.result.extended
-        dep = ext.dependencies if ext else None
+        dep = self._extended("dependencies")
         with VerticalScroll():
             yield Static("DEPENDENCY RISK SCANNER", classes="section-title")
             if not dep or not dep.dependencies:
-                yield Markdown("> _No dependencies detected._")
+                yield _empty_note("No dependencies detected.")
                 return
 
             yield Label(
@@ -375,30 +568,25 @@ class ResultsScreen(Screen):
                 yield Markdown(f"> {dep.llm_summary}")
 
             yield Static("DEPENDENCY LIST", classes="section-title")
-            table = DataTable()
+            table = DataTable(id="deps-table")
             table.add_columns(
                 "Package", "Version", "Ecosystem", "Source", "Risk"
             )
-            for d in dep.dependencies[:50]:
-                risk_icon = "⚠️" if d.risk_notes else "✅"
-                table.add_row(
-                    d.name,
-                    d.version or "—",
-                    d.ecosystem,
-                    d.source_file,
-                    f"{risk_icon} {d.risk_notes}" if d.risk_notes else risk_icon,
-                )
+            table.add_rows(map(_dependency_row, dep.dependencies[:self.FIRST_PAINT_ROWS]))
             yield table
+            more = Button("Load more", id="deps-more", classes="load-more")
+            if len(dep.dependencies) > self.VISIBLE_ROWS:
+                yield more
+            self._pending_streams.append((table, dep.dependencies, _dependency_row, more))
 
     # ── Reviews tab ───────────────────────────────────────────────────────
 
     def _compose_reviews(self) -> ComposeResult:
-        ext = self.result.extended
-        rc = ext.review_culture if ext else None
+        rc = self._extended("review_culture")
         with VerticalScroll():
             yield Static("REVIEW CULTURE ANALYZER", classes="section-title")
             if not rc or not rc.reviewers:
-                yield Markdown("> _No review data available._")
+                yield _empty_note("No review data available.")
                 return
 
             yield Label(
@@ -415,16 +603,8 @@ class ResultsScreen(Screen):
                 "Reviewer", "Reviews", "Avg Time (h)",
                 "Approvals", "Rejections", "Authors Reviewed"
             )
-            for r in rc.reviewers[:15]:
-                bottleneck = " 🔴" if r.login in rc.bottleneck_reviewers else ""
-                table.add_row(
-                    f"@{r.login}{bottleneck}",
-                    str(r.reviews_given),
-                    f"{r.avg_review_time_hours:.1f}",
-                    str(r.approvals),
-                    str(r.rejections),
-                    ", ".join(f"@{a}" for a in r.reviewed_authors[:3]),
-                )
+            bottlenecks = set(rc.bottleneck_reviewers)
+            table.add_rows([_reviewer_row(r, bottlenecks) for r in rc.reviewers[:15]])
             yield table
 
             if rc.bottleneck_reviewers:
@@ -441,12 +621,11 @@ class ResultsScreen(Screen):
     # ── Stale Branches tab ────────────────────────────────────────────────
 
     def _compose_stale_branches(self) -> ComposeResult:
-        ext = self.result.extended
-        sb = ext.stale_branches if ext else None
+        sb = self._extended("stale_branches")
         with VerticalScroll():
             yield Static("STALE BRANCH CEMETERY 🪦", classes="section-title")
             if not sb or not sb.stale_branches:
-                yield Markdown("> _No stale branches found. Branch hygiene looks good!_ 🎉")
+                yield _empty_note("No stale branches found. Branch hygiene looks good! 🎉")
                 return
 
             yield Label(
@@ -459,34 +638,25 @@ class ResultsScreen(Screen):
                 yield Markdown(f"> {sb.llm_summary}")
 
             yield Static("STALE BRANCHES", classes="section-title")
-            table = DataTable()
+            table = DataTable(id="stale-table")
             table.add_columns(
                 "Branch", "Days Stale", "Author", "Category", "Ahead/Behind"
             )
-            category_icons = {
-                "orphan": "👻", "wip": "🚧", "stale-feature": "🏚",
-                "stale-fix": "🩹", "abandoned": "💀",
-            }
-            for b in sb.stale_branches[:30]:
-                icon = category_icons.get(b.category, "❓")
-                table.add_row(
-                    b.name,
-                    str(b.days_stale),
-                    b.author or "—",
-                    f"{icon} {b.category}",
-                    b.ahead_behind,
-                )
+            table.add_rows(map(_stale_branch_row, sb.stale_branches[:self.FIRST_PAINT_ROWS]))
             yield table
+            more = Button("Load more", id="stale-more", classes="load-more")
+            if len(sb.stale_branches) > self.VISIBLE_ROWS:
+                yield more
+            self._pending_streams.append((table, sb.stale_branches, _stale_branch_row, more))
 
     # ── Changelog tab ─────────────────────────────────────────────────────
 
     def _compose_changelog(self) -> ComposeResult:
-        ext = self.result.extended
-        cl = ext.changelog if ext else None
+        cl = self._extended("changelog")
         with VerticalScroll():
             yield Static("COMMIT JOURNAL — AUTO-GENERATED CHANGELOG", classes="section-title")
             if not cl or not cl.entries:
-                yield Markdown("> _No changelog entries generated._")
+                yield _empty_note("No changelog entries generated.")
                 return
 
             yield Label(f"Total Entries: {len(cl.entries)}")
@@ -500,18 +670,10 @@ class ResultsScreen(Screen):
     # ── Bus Factor Mitigation tab ─────────────────────────────────────────
 
     def _compose_bus_factor(self) -> ComposeResult:
-        ext = self.result.extended
-        bm = ext.bus_mitigation if ext else None
+        bm = self._extended("bus_mitigation")
         with VerticalScroll():
             yield Static("BUS FACTOR MITIGATION PLAN", classes="section-title")
-            if not bm:
-                yield Markdown("> _No bus factor data available._")
-                return
-
-            risk_icons = {
-                "critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"
-            }
-            icon = risk_icons.get(bm.risk_level, "⚪")
+            icon = _RISK_ICONS.get(bm.risk_level, "⚪")
             yield Label(
                 f"Bus Factor: {bm.bus_factor}  ·  "
                 f"Risk Level: {icon} {bm.risk_level.upper()}"
@@ -528,22 +690,22 @@ class ResultsScreen(Screen):
 
             if bm.exclusive_files:
                 yield Static("EXCLUSIVE FILE OWNERSHIP", classes="section-title")
-                for login, files in list(bm.exclusive_files.items())[:5]:
-                    content = f"**@{login}** — {len(files)} exclusive file(s)\n\n"
-                    for f in files[:10]:
-                        content += f"- `{f}`\n"
-                    if len(files) > 10:
-                        content += f"\n... and {len(files) - 10} more"
+                for login, files in islice(bm.exclusive_files.items(), 5):
+                    n_files = len(files)
+                    parts = [f"**@{login}** — {n_files} exclusive file(s)\n\n"]
+                    parts.extend([f"- `{f}`\n" for f in files[:10]])
+                    if n_files > 10:
+                        parts.append(f"\n... and {n_files - 10} more")
+                    content = "".join(parts)
                     with Vertical(classes="insight-card"):
                         yield Markdown(content)
 
             if bm.actions:
                 yield Static("RECOMMENDED ACTIONS", classes="section-title")
                 for action in bm.actions:
-                    md = (
-                        f"**Priority {action.priority}:** {action.action}\n\n"
-                        f"Target: @{action.target_contributor} · `{action.target_area}`\n\n"
-                        f"_{action.rationale}_"
+                    md = _action_md(
+                        action.priority, action.action, action.target_contributor,
+                        action.target_area, action.rationale,
                     )
                     with Vertical(classes="insight-card"):
                         yield Markdown(md)
@@ -551,49 +713,75 @@ class ResultsScreen(Screen):
     # ── What-If Simulator tab ─────────────────────────────────────────────
 
     def _compose_what_if(self) -> ComposeResult:
-        ext = self.result.extended
-        wi = ext.what_if if ext else None
+        wi = self._extended("what_if")
         with VerticalScroll():
             yield Static("WHAT-IF SIMULATOR 🔮", classes="section-title")
             if not wi or not wi.scenarios:
-                yield Markdown("> _No what-if simulations available._")
+                yield _empty_note("No what-if simulations available.")
                 return
 
             if wi.llm_summary:
                 yield Markdown(f"> {wi.llm_summary}")
 
             for s in wi.scenarios:
-                if s.scenario == "remove_contributor":
-                    title = f"🚪 What if @{s.parameter} leaves?"
-                    bus_text = f"Bus Factor: {s.bus_factor_before} → {s.bus_factor_after}"
-                    delta = s.bus_factor_after - s.bus_factor_before
-                    trend = "📉" if delta < 0 else ("📊" if delta == 0 else "📈")
-                elif s.scenario == "deprecate_module":
-                    title = f"🗑 What if `{s.parameter}/` is deprecated?"
-                    bus_text = ""
-                    trend = "📊"
-                else:
-                    title = f"❓ {s.scenario}: {s.parameter}"
-                    bus_text = ""
-                    trend = "📊"
-
-                md = f"### {title}\n\n"
-                if bus_text:
-                    md += f"{trend} {bus_text}\n\n"
-                if s.orphaned_files:
-                    md += f"**Orphaned files:** {len(s.orphaned_files)}\n"
-                    for f in s.orphaned_files[:5]:
-                        md += f"- `{f}`\n"
-                    if len(s.orphaned_files) > 5:
-                        md += f"- ... and {len(s.orphaned_files) - 5} more\n"
-                if s.affected_areas:
-                    md += f"\n**Affected areas:** {', '.join(s.affected_areas)}\n"
-                if s.impact_summary:
-                    md += f"\n💡 _{s.impact_summary}_"
-
+                md = _scenario_md(
+                    s.scenario, s.parameter, s.bus_factor_before, s.bus_factor_after,
+                    tuple(s.orphaned_files), tuple(s.affected_areas), s.impact_summary,
+                )
                 with Vertical(classes="insight-card"):
                     yield Markdown(md)
 
+    # ── Load more ─────────────────────────────────────────────────────────
+
+    def _start_pending_streams(self) -> None:
+        """Start streaming the tables queued while composing the tab just mounted."""
+        pending, self._pending_streams = self._pending_streams, []
+        for table, items, to_row, button in pending:
+            self._stream_rows(table, items, to_row, button)
+
+    def _stream_rows(
+        self, table: DataTable, items: list, to_row: Callable, button: Button
+    ) -> None:
+        """Fill *table* up to the end of its current ``VISIBLE_ROWS`` page in the background.
+
+        *button* ("Load more") is disabled while rows are streaming and
+        hidden once every item is shown.
+        """
+        start = table.row_count
+        end = (start // self.VISIBLE_ROWS + 1) * self.VISIBLE_ROWS
+        button.disabled = True
+        self.run_worker(
+            self._add_rows_in_chunks(table, items, start, end, to_row, button),
+            group="table-fill",
+        )
+
+    async def _add_rows_in_chunks(
+        self, table: DataTable, items: list, start: int, end: int,
+        to_row: Callable, button: Button,
+    ) -> None:
+        for i in range(start, min(end, len(items)), self.STREAM_CHUNK):
+            await asyncio.sleep(0)
+            table.add_rows(map(to_row, items[i:min(i + self.STREAM_CHUNK, end)]))
+        button.disabled = False
+        if table.row_count >= len(items):
+            button.display = False
+
+    @on(Button.Pressed, "#deps-more")
+    def _load_more_dependencies(self, event: Button.Pressed) -> None:
+        dep = self._extended("dependencies")
+        if dep is None:
+            return
+        table = self.query_one("#deps-table", DataTable)
+        self._stream_rows(table, dep.dependencies, _dependency_row, event.button)
+
+    @on(Button.Pressed, "#stale-more")
+    def _load_more_stale_branches(self, event: Button.Pressed) -> None:
+        sb = self._extended("stale_branches")
+        if sb is None:
+            return
+        table = self.query_one("#stale-table", DataTable)
+        self._stream_rows(table, sb.stale_branches, _stale_branch_row, event.button)
+
     # ── Actions ───────────────────────────────────────────────────────────
 
     def action_go_back(self) -> None:
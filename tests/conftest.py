@@ -2,6 +2,46 @@
 
 import pytest
 
+from repo_inspector.models import ContributorStats, FolderAnalysis, FunctionalArea
+
+
+class FakeCloner:
+    """RepoCloner stand-in serving pre-seeded data keyed by folder or path.
+
+    It does no filtering or truncation of its own; instead it records the
+    arguments of each listing and read, so tests assert on what the code
+    under test asked the cloner for.
+    """
+
+    def __init__(self, stats=None, langs=None, files=None, bodies=None, deps=None):
+        self._stats = stats or {}
+        self._langs = langs or {}
+        self._files = files or {}
+        self._bodies = bodies or {}
+        self._deps = deps or []
+        self.listings = []  # (subdir, extensions)
+        self.reads = []  # (relpath, max_lines)
+
+    def list_top_level_dirs(self):
+        return list(self._stats)
+
+    def folder_stats(self, subdir):
+        return self._stats[subdir]
+
+    def detect_languages(self, subdir):
+        return self._langs[subdir]
+
+    def list_files_in_dir(self, subdir, extensions=None):
+        self.listings.append((subdir, extensions))
+        return list(self._files.get(subdir, ()))
+
+    def read_file(self, relpath, max_lines=500):
+        self.reads.append((relpath, max_lines))
+        return self._bodies[relpath]
+
+    def parse_dependencies(self):
+        return self._deps
+
 
 @pytest.fixture(scope="session")
 def anyio_backend():
@@ -9,6 +49,30 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(scope="session")
+def fake_cloner():
+    """The FakeCloner class, for building a cloner seeded with per-test data."""
+    return FakeCloner
+
+
+@pytest.fixture(scope="session")
+def alice_stats():
+    """Read-only contributor stats for ``alice`` with 10 commits."""
+    return ContributorStats(login="alice", commit_count=10)
+
+
+@pytest.fixture
+def src_folder_analysis():
+    """``src`` folder analysis (fresh per test: code analysis attaches findings to it)."""
+    return FolderAnalysis(path="src", file_count=5, total_lines=100, languages=["Python"])
+
+
+@pytest.fixture
+def src_area():
+    """``src`` functional area (fresh per test: parsing fills in improvement notes)."""
+    return FunctionalArea(name="src", path="src")
+
+
 @pytest.fixture
 def sample_tree_text():
     """A sample directory tree for testing."""
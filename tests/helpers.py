@@ -0,0 +1,8 @@
+"""Plain helpers shared by several test modules."""
+
+import httpx
+
+
+def json_response(body: bytes) -> httpx.Response:
+    """200 response carrying a pre-serialized JSON *body*, for respx/MockTransport routes."""
+    return httpx.Response(200, content=body, headers={"content-type": "application/json"})
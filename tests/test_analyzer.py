@@ -2,50 +2,145 @@
 
 import json
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from repo_inspector.analyzer import Analyzer
+from repo_inspector.cloner import RepoCloner
+from repo_inspector.fetcher import GitHubFetcher
 from repo_inspector.models import (
     BusFactorMitigationReport,
-    CodeFinding,
     CodeReport,
-    ContributorInsight,
     ContributorStats,
     FolderAnalysis,
     FunctionalArea,
     FunctionalReport,
     InspectionResult,
-    MitigationAction,
     PeopleReport,
+    ReviewCultureReport,
     SeverityLevel,
+    StaleBranchReport,
     Timeframe,
+    TimeMachineReport,
     WhatIfReport,
     WhatIfScenario,
 )
 
 
+def _return(value):
+    """Plain stub returning *value*; cheaper than MagicMock when no call asserts are needed."""
+    return lambda *_args, **_kwargs: value
+
+
+def _async_return(value):
+    """Async counterpart of ``_return``."""
+    async def _f(*_args, **_kwargs):
+        return value
+    return _f
+
+
+def _async_raise(exc):
+    """Async stub that raises *exc* when awaited."""
+    async def _f(*_args, **_kwargs):
+        raise exc
+    return _f
+
+
+def _install(target, **attrs):
+    """Set several instance attributes on a plain object in one dict update."""
+    vars(target).update(attrs)
+
+
+_SINCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_UNTIL = datetime(2025, 2, 1, tzinfo=timezone.utc)
+_TF = Timeframe(since=_SINCE, until=_UNTIL)
+
+# Canned LLM responses, serialized once.
+_DEPS_LLM_JSON = json.dumps({
+    "risk_notes": {"flask": "Consider updating"},
+    "summary": "Dependencies look good overall.",
+})
+
+_MITIGATION_LLM_JSON = json.dumps({
+    "actions": [
+        {
+            "priority": 1,
+            "action": "Pair program",
+            "target_contributor": "alice",
+            "target_area": "src",
+            "rationale": "Spread knowledge",
+        }
+    ],
+    "summary": "Focus on knowledge sharing.",
+})
+
+_WHAT_IF_LLM_JSON = json.dumps({
+    "impact_summaries": {
+        "remove_contributor:alice": "Major impact on auth module",
+    },
+    "summary": "Alice is critical.",
+})
+
+_PEOPLE_LLM_JSON = json.dumps([{
+    "login": "alice",
+    "inferred_role": "Backend Engineer",
+    "activity_summary": "Active",
+    "judgment": "Strong",
+    "risk_notes": "",
+}])
+
+_CODE_LLM_JSON = json.dumps([
+    {
+        "category": "security",
+        "severity": "high",
+        "title": "SQL Injection",
+        "description": "Unsanitized input",
+        "suggestion": "Parameterize queries",
+        "file": "src/db.py",
+    }
+])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _offline_llm():
+    """Default every Analyzer's ``_ask_llm`` to an empty reply so no test reaches Copilot.
+
+    Tests that care about the response still override ``_ask_llm`` on the instance.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Analyzer, "_ask_llm", _async_return(""))
+        yield
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """One Analyzer shared by the pure parsing / LLM-list tests."""
+    return Analyzer(token="test")
+
+
 class TestAnalyzerInit:
     def test_init_with_token(self):
         analyzer = Analyzer(token="my-token")
         assert analyzer.token == "my-token"
         assert analyzer.model == "gpt-4.1"
 
-    def test_init_without_token(self):
-        with patch.dict("os.environ", {}, clear=True):
-            analyzer = Analyzer()
-            assert analyzer.token is None
+    def test_init_without_token(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        analyzer = Analyzer()
+        assert analyzer.token is None
 
-    def test_init_with_env_token(self):
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "env-token"}):
-            analyzer = Analyzer()
-            assert analyzer.token == "env-token"
+    def test_init_with_env_token(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+        analyzer = Analyzer()
+        assert analyzer.token == "env-token"
 
-    def test_init_with_gh_token(self):
-        with patch.dict("os.environ", {"GH_TOKEN": "gh-token"}, clear=True):
-            analyzer = Analyzer()
-            assert analyzer.token == "gh-token"
+    def test_init_with_gh_token(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setenv("GH_TOKEN", "gh-token")
+        analyzer = Analyzer()
+        assert analyzer.token == "gh-token"
 
     def test_init_custom_model(self):
         analyzer = Analyzer(model="gpt-3.5-turbo")
@@ -63,47 +158,24 @@ class TestAnalyzerInit:
 
 
 class TestParseContributorInsights:
-    def setup_method(self):
-        self.analyzer = Analyzer(token="test")
-
-    def test_parses_valid_json(self):
-        raw = json.dumps([
-            {
-                "login": "alice",
-                "inferred_role": "Backend Engineer",
-                "activity_summary": "Active contributor",
-                "judgment": "Strong contributor",
-                "risk_notes": "",
-            }
-        ])
-        insights = self.analyzer._parse_contributor_insights(raw)
+    def test_parses_valid_json(self, analyzer):
+        insights = analyzer._parse_contributor_insights(_PEOPLE_LLM_JSON)
         assert len(insights) == 1
         assert insights[0].login == "alice"
         assert insights[0].inferred_role == "Backend Engineer"
 
-    def test_parses_json_with_fences(self):
-        raw = '```json\n[{"login": "bob", "activity_summary": "writes code"}]\n```'
-        insights = self.analyzer._parse_contributor_insights(raw)
-        assert len(insights) == 1
-        assert insights[0].login == "bob"
-
-    def test_handles_invalid_json(self):
-        raw = "This is not JSON at all"
-        insights = self.analyzer._parse_contributor_insights(raw)
-        assert len(insights) == 1
-        assert insights[0].login == "(parse error)"
-
-    def test_handles_empty_array(self):
-        raw = "[]"
-        insights = self.analyzer._parse_contributor_insights(raw)
-        assert insights == []
+    @pytest.mark.parametrize("raw,expected", [
+        ('```json\n[{"login": "bob", "activity_summary": "writes code"}]\n```', ["bob"]),
+        ("This is not JSON at all", ["(parse error)"]),
+        ("[]", []),
+    ], ids=["fenced", "invalid", "empty"])
+    def test_parse_outcomes(self, analyzer, raw, expected):
+        insights = analyzer._parse_contributor_insights(raw)
+        assert [i.login for i in insights] == expected
 
 
 class TestParseFunctionalReport:
-    def setup_method(self):
-        self.analyzer = Analyzer(token="test")
-
-    def test_parses_valid_json(self):
+    def test_parses_valid_json(self, analyzer):
         areas = [
             FunctionalArea(name="src", path="src", description="Source code"),
         ]
@@ -114,29 +186,22 @@ class TestParseFunctionalReport:
             "area_improvements": {"src": "Add more tests"},
             "summary": "Good repo",
         })
-        report = self.analyzer._parse_functional_report(raw, areas)
+        report = analyzer._parse_functional_report(raw, areas)
         assert report.repo_description == "A test repo"
         assert "Python" in report.tech_stack
         assert areas[0].improvement_notes == "Add more tests"
 
-    def test_handles_invalid_json(self):
-        areas = [FunctionalArea(name="src", path="src")]
-        raw = "Not valid JSON"
-        report = self.analyzer._parse_functional_report(raw, areas)
-        assert report.llm_summary == "(Failed to parse LLM response)"
-
-    def test_handles_json_with_fences(self):
-        areas = []
-        raw = '```json\n{"repo_description": "test", "summary": "ok"}\n```'
-        report = self.analyzer._parse_functional_report(raw, areas)
-        assert report.repo_description == "test"
+    @pytest.mark.parametrize("raw,field,expected", [
+        ("Not valid JSON", "llm_summary", "(Failed to parse LLM response)"),
+        ('```json\n{"repo_description": "test", "summary": "ok"}\n```', "repo_description", "test"),
+    ], ids=["invalid", "fenced"])
+    def test_parse_outcomes(self, analyzer, src_area, raw, field, expected):
+        report = analyzer._parse_functional_report(raw, [src_area])
+        assert getattr(report, field) == expected
 
 
 class TestParseCodeFindings:
-    def setup_method(self):
-        self.analyzer = Analyzer(token="test")
-
-    def test_parses_valid_findings(self):
+    def test_parses_valid_findings(self, analyzer):
         raw = json.dumps([
             {
                 "category": "security",
@@ -155,60 +220,37 @@ class TestParseCodeFindings:
                 "file": "src/main.py",
             },
         ])
-        findings = self.analyzer._parse_code_findings(raw, "src")
+        findings = analyzer._parse_code_findings(raw, "src")
         assert len(findings) == 2
         assert findings[0].category == "security"
         assert findings[0].severity == SeverityLevel.high
         assert findings[0].id == "src-1"
         assert findings[1].id == "src-2"
 
-    def test_handles_invalid_json(self):
-        findings = self.analyzer._parse_code_findings("not json", "src")
-        assert findings == []
-
-    def test_handles_empty_array(self):
-        findings = self.analyzer._parse_code_findings("[]", "src")
-        assert findings == []
-
-    def test_parses_with_markdown_fences(self):
-        raw = '```\n[{"category":"style","severity":"info","title":"Naming","description":"bad name","suggestion":"rename"}]\n```'
-        findings = self.analyzer._parse_code_findings(raw, "utils")
-        assert len(findings) == 1
-        assert findings[0].folder == "utils"
+    @pytest.mark.parametrize("raw,expected_count", [
+        ("not json", 0),
+        ("[]", 0),
+        ('```\n[{"category":"style","severity":"info","title":"Naming","description":"bad name","suggestion":"rename"}]\n```', 1),
+    ], ids=["invalid", "empty", "fenced"])
+    def test_parse_outcomes(self, analyzer, raw, expected_count):
+        findings = analyzer._parse_code_findings(raw, "utils")
+        assert len(findings) == expected_count
+        assert all(f.folder == "utils" for f in findings)
 
 
 class TestAskLlmList:
-    def setup_method(self):
-        self.analyzer = Analyzer(token="test")
-
-    @pytest.mark.asyncio
-    async def test_parses_json_list(self):
-        self.analyzer._ask_llm = AsyncMock(return_value='["item1", "item2"]')
-        result = await self.analyzer._ask_llm_list("test prompt")
-        assert result == ["item1", "item2"]
-
-    @pytest.mark.asyncio
-    async def test_handles_invalid_json(self):
-        self.analyzer._ask_llm = AsyncMock(return_value="not json")
-        result = await self.analyzer._ask_llm_list("test prompt")
-        assert len(result) == 1
-        assert "not json" in result[0]
-
-    @pytest.mark.asyncio
-    async def test_handles_empty_response(self):
-        self.analyzer._ask_llm = AsyncMock(return_value="")
-        result = await self.analyzer._ask_llm_list("test prompt")
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_strips_markdown_fences(self):
-        self.analyzer._ask_llm = AsyncMock(return_value='```json\n["a", "b"]\n```')
-        result = await self.analyzer._ask_llm_list("test prompt")
-        assert result == ["a", "b"]
+    @pytest.mark.parametrize("response,expected", [
+        ('["item1", "item2"]', ["item1", "item2"]),
+        ('```json\n["a", "b"]\n```', ["a", "b"]),
+        ("not json", ["not json"]),
+        ("", []),
+    ], ids=["list", "fenced", "invalid", "empty"])
+    async def test_parse_outcomes(self, analyzer, monkeypatch, response, expected):
+        monkeypatch.setattr(analyzer, "_ask_llm", _async_return(response))
+        assert await analyzer._ask_llm_list("test prompt") == expected
 
 
 class TestAnalyzerClose:
-    @pytest.mark.asyncio
     async def test_close_cleans_up(self):
         analyzer = Analyzer(token="test")
         analyzer._fetcher.close = AsyncMock()
@@ -217,11 +259,19 @@ class TestAnalyzerClose:
         analyzer._fetcher.close.assert_called_once()
         analyzer._cloner.cleanup.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_close_leaves_borrowed_fetcher_open(self):
+        fetcher = MagicMock()
+        fetcher.close = AsyncMock()
+        analyzer = Analyzer(token="test", fetcher=fetcher)
+        analyzer._cloner.cleanup = MagicMock()
+        await analyzer.close()
+        fetcher.close.assert_not_called()
+        analyzer._cloner.cleanup.assert_called_once()
+
     async def test_close_with_copilot_session(self):
         analyzer = Analyzer(token="test")
-        analyzer._fetcher.close = AsyncMock()
-        analyzer._cloner.cleanup = MagicMock()
+        analyzer._fetcher.close = _async_return(None)
+        analyzer._cloner.cleanup = _return(None)
         mock_session = MagicMock()
         mock_session.destroy = AsyncMock()
         analyzer._copilot_session = mock_session
@@ -234,17 +284,11 @@ class TestAnalyzerClose:
 
 
 class TestAnalyzeDependenciesLlm:
-    @pytest.mark.asyncio
     async def test_enriches_report(self):
         from repo_inspector.models import DependencyInfo, DependencyReport
 
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(
-            return_value=json.dumps({
-                "risk_notes": {"flask": "Consider updating"},
-                "summary": "Dependencies look good overall.",
-            })
-        )
+        analyzer._ask_llm = _async_return(_DEPS_LLM_JSON)
         report = DependencyReport(
             dependencies=[
                 DependencyInfo(name="flask", version=">=2.0", ecosystem="python"),
@@ -258,12 +302,11 @@ class TestAnalyzeDependenciesLlm:
         flask_dep = next(d for d in result.dependencies if d.name == "flask")
         assert flask_dep.risk_notes == "Consider updating"
 
-    @pytest.mark.asyncio
     async def test_handles_invalid_llm_response(self):
         from repo_inspector.models import DependencyInfo, DependencyReport
 
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(return_value="Not valid json!")
+        analyzer._ask_llm = _async_return("Not valid json!")
         report = DependencyReport(
             dependencies=[DependencyInfo(name="flask", ecosystem="python")],
             total_deps=1,
@@ -273,23 +316,9 @@ class TestAnalyzeDependenciesLlm:
 
 
 class TestAnalyzeMitigationLlm:
-    @pytest.mark.asyncio
     async def test_generates_actions(self):
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(
-            return_value=json.dumps({
-                "actions": [
-                    {
-                        "priority": 1,
-                        "action": "Pair program",
-                        "target_contributor": "alice",
-                        "target_area": "src",
-                        "rationale": "Spread knowledge",
-                    }
-                ],
-                "summary": "Focus on knowledge sharing.",
-            })
-        )
+        analyzer._ask_llm = _async_return(_MITIGATION_LLM_JSON)
         report = BusFactorMitigationReport(
             bus_factor=1,
             risk_level="critical",
@@ -303,17 +332,9 @@ class TestAnalyzeMitigationLlm:
 
 
 class TestAnalyzeWhatIfLlm:
-    @pytest.mark.asyncio
     async def test_enriches_scenarios(self):
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(
-            return_value=json.dumps({
-                "impact_summaries": {
-                    "remove_contributor:alice": "Major impact on auth module",
-                },
-                "summary": "Alice is critical.",
-            })
-        )
+        analyzer._ask_llm = _async_return(_WHAT_IF_LLM_JSON)
         report = WhatIfReport(
             scenarios=[
                 WhatIfScenario(
@@ -331,75 +352,85 @@ class TestAnalyzeWhatIfLlm:
         assert result.scenarios[0].impact_summary == "Major impact on auth module"
 
 
-class TestInspect:
-    @pytest.mark.asyncio
-    async def test_full_inspect_pipeline(self):
-        """Test the full inspect pipeline with all external calls mocked."""
-        from repo_inspector.models import Commit, PullRequest, Issue
-
-        analyzer = Analyzer(token="test")
-        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        until = datetime(2025, 2, 1, tzinfo=timezone.utc)
-
-        # Mock fetcher
-        mock_commits = [
-            Commit(
-                sha="abc123", message="feat: add auth", author_name="Alice",
-                author_login="alice", date=since, url="https://example.com/c/1",
-                additions=100, deletions=10, files_changed=["src/auth.py"],
-            ),
-        ]
-        mock_prs = [
-            PullRequest(
-                number=1, title="Add auth", author="alice",
-                created_at=since, merged_at=since, url="https://example.com/pr/1",
-            ),
-        ]
-        mock_issues = [
-            Issue(
-                number=10, title="Bug", author="bob", state="open",
-                created_at=since, url="https://example.com/i/10",
-            ),
-        ]
-
-        analyzer._fetcher.fetch_commits = AsyncMock(return_value=mock_commits)
-        analyzer._fetcher.fetch_pull_requests = AsyncMock(return_value=mock_prs)
-        analyzer._fetcher.fetch_issues = AsyncMock(return_value=mock_issues)
-        analyzer._fetcher.fetch_commit_detail = AsyncMock(return_value={
+@pytest.fixture
+def mocked_inspect_analyzer(src_area):
+    """Analyzer whose fetcher, cloner and LLM calls are all stubbed for inspect()."""
+    from repo_inspector.models import Commit, Issue, PullRequest
+
+    analyzer = Analyzer(token="test", fetcher=MagicMock(spec_set=GitHubFetcher))
+
+    mock_commits = [
+        Commit(
+            sha="abc123", message="feat: add auth", author_name="Alice",
+            author_login="alice", date=_SINCE, url="https://example.com/c/1",
+            additions=100, deletions=10, files_changed=["src/auth.py"],
+        ),
+    ]
+    mock_prs = [
+        PullRequest(
+            number=1, title="Add auth", author="alice",
+            created_at=_SINCE, merged_at=_SINCE, url="https://example.com/pr/1",
+        ),
+    ]
+    mock_issues = [
+        Issue(
+            number=10, title="Bug", author="bob", state="open",
+            created_at=_SINCE, url="https://example.com/i/10",
+        ),
+    ]
+
+    fetcher = analyzer._fetcher
+    fetcher.configure_mock(**{
+        "is_unauthenticated": False,
+        "fetch_commits.return_value": mock_commits,
+        "fetch_pull_requests.return_value": mock_prs,
+        "fetch_issues.return_value": mock_issues,
+        "fetch_commit_detail.return_value": {
             "stats": {"additions": 50, "deletions": 5},
             "files": [{"filename": "src/auth.py"}],
-        })
-        analyzer._fetcher.fetch_readme = AsyncMock(return_value="# Test Repo")
-        analyzer._fetcher.fetch_repo_info = AsyncMock(return_value={
+        },
+        "fetch_readme.return_value": "# Test Repo",
+        "fetch_repo_info.return_value": {
             "description": "Test", "topics": ["python"], "default_branch": "main",
-        })
-        analyzer._fetcher._saml_fallback = False
-        analyzer._fetcher.fetch_branches = AsyncMock(return_value=[])
-        analyzer._fetcher.fetch_default_branch = AsyncMock(return_value="main")
-
-        # Mock cloner
-        analyzer._cloner.clone = MagicMock(return_value=MagicMock())
-        analyzer._cloner.list_top_level_dirs = MagicMock(return_value=["src", "tests"])
-        analyzer._cloner.folder_stats = MagicMock(return_value={"files": 5, "lines": 100})
-        analyzer._cloner.detect_languages = MagicMock(return_value=["Python"])
-        analyzer._cloner.list_files_in_dir = MagicMock(return_value=[])
-        analyzer._cloner.get_tree_summary = MagicMock(return_value="src/\n  main.py")
-        analyzer._cloner.read_file = MagicMock(return_value="")
-        analyzer._cloner.parse_dependencies = MagicMock(return_value=[])
-        analyzer._cloner.detect_dependency_files = MagicMock(return_value={})
-
-        # Mock LLM
-        analyzer._ask_llm = AsyncMock(return_value="Test summary")
-        analyzer._ask_llm_list = AsyncMock(return_value=["suggestion 1"])
-        analyzer._analyze_people_llm = AsyncMock(return_value=[])
-        analyzer._analyze_functional_llm = AsyncMock(return_value=FunctionalReport(
+        },
+        "fetch_branches.return_value": [],
+        "fetch_default_branch.return_value": "main",
+    })
+
+    cloner = MagicMock(spec_set=RepoCloner, **{
+        "clone.return_value": MagicMock(),
+        "list_top_level_dirs.return_value": ["src", "tests"],
+        "folder_stats.return_value": {"files": 5, "lines": 100},
+        "detect_languages.return_value": ["Python"],
+        "list_files_in_dir.return_value": [],
+        "get_tree_summary.return_value": "src/\n  main.py",
+        "read_file.return_value": "",
+        "parse_dependencies.return_value": [],
+        "detect_dependency_files.return_value": {},
+    })
+
+    _install(
+        analyzer,
+        _cloner=cloner,
+        _ask_llm_list=_async_return(["suggestion 1"]),
+        _analyze_people_llm=_async_return([]),
+        _analyze_functional_llm=_async_return(FunctionalReport(
             repo_description="Test repo",
-            areas=[FunctionalArea(name="src", path="src")],
-        ))
-        analyzer._analyze_code_llm = AsyncMock(return_value=CodeReport())
-        analyzer._run_extended_analyses = AsyncMock(return_value=None)
+            areas=[src_area],
+        )),
+        _analyze_code_llm=_async_return(CodeReport()),
+        _run_extended_analyses=_async_return(None),
+    )
+    return analyzer
 
-        result = await analyzer.inspect("owner", "repo", since, until)
+
+class TestInspect:
+    @pytest.mark.slow
+    async def test_full_inspect_pipeline(self, mocked_inspect_analyzer):
+        """Test the full inspect pipeline with all external calls mocked."""
+        analyzer = mocked_inspect_analyzer
+
+        result = await analyzer.inspect("owner", "repo", _SINCE, _UNTIL)
 
         assert result.repo == "owner/repo"
         assert result.people.total_contributors >= 1
@@ -409,53 +440,33 @@ class TestInspect:
 
 
 class TestAnalyzePeopleLlm:
-    @pytest.mark.asyncio
     async def test_returns_insights(self):
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(
-            return_value=json.dumps([{
-                "login": "alice",
-                "inferred_role": "Backend Engineer",
-                "activity_summary": "Active",
-                "judgment": "Strong",
-                "risk_notes": "",
-            }])
-        )
+        analyzer._ask_llm = _async_return(_PEOPLE_LLM_JSON)
         stats = [ContributorStats(
             login="alice", commit_count=10, lines_added=500,
             lines_removed=50, prs_opened=3, prs_merged=2,
             top_directories=["src"],
         )]
-        tf = Timeframe(
-            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            until=datetime(2025, 2, 1, tzinfo=timezone.utc),
-        )
-        insights = await analyzer._analyze_people_llm("owner", "repo", stats, tf)
+        insights = await analyzer._analyze_people_llm("owner", "repo", stats, _TF)
         assert len(insights) == 1
         assert insights[0].login == "alice"
 
-    @pytest.mark.asyncio
     async def test_empty_stats_returns_empty(self):
         analyzer = Analyzer(token="test")
-        tf = Timeframe(
-            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            until=datetime(2025, 2, 1, tzinfo=timezone.utc),
-        )
-        result = await analyzer._analyze_people_llm("owner", "repo", [], tf)
+        result = await analyzer._analyze_people_llm("owner", "repo", [], _TF)
         assert result == []
 
 
 class TestAnalyzeReviewCulture:
-    @pytest.mark.asyncio
     async def test_builds_review_report(self):
         from repo_inspector.models import PullRequest
 
         analyzer = Analyzer(token="test")
-        analyzer._fetcher.fetch_pr_reviews = AsyncMock(return_value=[
+        analyzer._fetcher.fetch_pr_reviews = _async_return([
             {"id": 1, "user": {"login": "bob"}, "state": "APPROVED",
              "submitted_at": "2025-01-12T10:00:00Z"},
         ])
-        analyzer._ask_llm = AsyncMock(return_value="Review culture is healthy.")
 
         prs = [
             PullRequest(
@@ -469,66 +480,54 @@ class TestAnalyzeReviewCulture:
 
 
 class TestAnalyzeStaleBranches:
-    @pytest.mark.asyncio
-    async def test_builds_stale_report(self):
-        analyzer = Analyzer(token="test")
-        analyzer._fetcher.fetch_branches = AsyncMock(return_value=[
+    async def test_builds_stale_report(self, analyzer, monkeypatch):
+        monkeypatch.setattr(analyzer._fetcher, "fetch_branches", _async_return([
             {"name": "main", "commit": {"sha": "abc", "commit": {"author": {"date": "2025-01-15T00:00:00Z"}}}},
             {"name": "old-feat", "commit": {"sha": "def", "commit": {"author": {"date": "2024-01-01T00:00:00Z"}}}},
-        ])
-        analyzer._fetcher.fetch_default_branch = AsyncMock(return_value="main")
-        analyzer._fetcher.fetch_branch_compare = AsyncMock(return_value={"ahead_by": 3, "behind_by": 12})
-        analyzer._ask_llm = AsyncMock(return_value="Branch hygiene needs attention.")
+        ]))
+        monkeypatch.setattr(analyzer._fetcher, "fetch_default_branch", _async_return("main"))
+        monkeypatch.setattr(analyzer._fetcher, "fetch_branch_compare", _async_return({"ahead_by": 3, "behind_by": 12}))
 
         report = await analyzer._analyze_stale_branches("owner", "repo")
         assert report.total_branches >= 0
 
-    @pytest.mark.asyncio
-    async def test_handles_exception(self):
-        analyzer = Analyzer(token="test")
-        analyzer._fetcher.fetch_branches = AsyncMock(side_effect=Exception("Network error"))
+    async def test_handles_exception(self, analyzer, monkeypatch):
+        monkeypatch.setattr(analyzer._fetcher, "fetch_branches", _async_raise(Exception("Network error")))
 
         report = await analyzer._analyze_stale_branches("owner", "repo")
         assert report.total_branches == 0
 
 
 class TestRunExtendedAnalyses:
-    @pytest.mark.asyncio
-    async def test_runs_all_analyses(self):
-        from repo_inspector.models import (
-            Commit, PullRequest, Issue, ExtendedResult
-        )
+    async def test_runs_all_analyses(self, alice_stats):
+        from repo_inspector.models import Commit, Issue, PullRequest
 
         analyzer = Analyzer(token="test")
         analyzer._fetcher._saml_fallback = False
 
-        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        until = datetime(2025, 2, 1, tzinfo=timezone.utc)
-        tf = Timeframe(since=since, until=until)
-
         commits = [
             Commit(
                 sha="abc123", message="feat: auth", author_name="Alice",
-                author_login="alice", date=since, url="https://x.com/c/1",
+                author_login="alice", date=_SINCE, url="https://x.com/c/1",
                 additions=100, deletions=10, files_changed=["src/auth.py"],
             ),
         ]
         prs = [
             PullRequest(
                 number=1, title="Add auth", author="alice",
-                created_at=since, merged_at=since, url="https://x.com/pr/1",
+                created_at=_SINCE, merged_at=_SINCE, url="https://x.com/pr/1",
             ),
         ]
         issues = [
             Issue(
                 number=10, title="Bug", author="bob",
-                created_at=since, url="https://x.com/i/10",
+                created_at=_SINCE, url="https://x.com/i/10",
             ),
         ]
-        stats = [ContributorStats(login="alice", commit_count=10)]
+        stats = [alice_stats]
 
         result = InspectionResult(
-            repo="owner/repo", timeframe=tf,
+            repo="owner/repo", timeframe=_TF,
             people=PeopleReport(
                 total_contributors=1, stats=stats, bus_factor=1,
             ),
@@ -537,25 +536,29 @@ class TestRunExtendedAnalyses:
         )
 
         # Mock everything
-        analyzer._cloner.list_top_level_dirs = MagicMock(return_value=["src"])
-        analyzer._cloner.parse_dependencies = MagicMock(return_value=[])
-        analyzer._cloner.detect_dependency_files = MagicMock(return_value={})
-        analyzer._ask_llm = AsyncMock(return_value="Summary text")
-        analyzer._ask_llm_list = AsyncMock(return_value=["pair suggestion"])
-        analyzer._analyze_dependencies_llm = AsyncMock(side_effect=lambda o, r, rep: rep)
-        analyzer._analyze_review_culture = AsyncMock(
-            return_value=MagicMock(reviewers=[], llm_summary="")
+        async def _passthrough(_owner, _repo, report):
+            return report
+
+        _install(
+            analyzer._cloner,
+            list_top_level_dirs=_return(["src"]),
+            parse_dependencies=_return([]),
+            detect_dependency_files=_return({}),
         )
-        analyzer._analyze_stale_branches = AsyncMock(
-            return_value=MagicMock(stale_branches=[], llm_summary="")
-        )
-        analyzer._analyze_what_if_llm = AsyncMock(
-            return_value=WhatIfReport(scenarios=[])
+        _install(
+            analyzer,
+            _ask_llm_list=_async_return(["pair suggestion"]),
+            _analyze_dependencies_llm=_passthrough,
+            _analyze_review_culture=_async_return(ReviewCultureReport()),
+            _analyze_stale_branches=_async_return(StaleBranchReport()),
+            _analyze_what_if_llm=_async_return(WhatIfReport(scenarios=[])),
+            _run_time_machine=_async_return(
+                TimeMachineReport(old_timeframe=_TF, new_timeframe=_TF)
+            ),
         )
-        analyzer._run_time_machine = AsyncMock(return_value=MagicMock())
 
         extended = await analyzer._run_extended_analyses(
-            "owner", "repo", result, tf, since, until
+            "owner", "repo", result, _TF, _SINCE, _UNTIL
         )
 
         assert extended.knowledge_map is not None
@@ -566,54 +569,32 @@ class TestRunExtendedAnalyses:
 
 
 class TestAnalyzeCodeLlm:
-    @pytest.mark.asyncio
-    async def test_analyze_code_folders(self):
+    async def test_analyze_code_folders(self, monkeypatch, src_folder_analysis):
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(return_value=json.dumps([
-            {
-                "category": "security",
-                "severity": "high",
-                "title": "SQL Injection",
-                "description": "Unsanitized input",
-                "suggestion": "Parameterize queries",
-                "file": "src/db.py",
-            }
-        ]))
-        analyzer._cloner = MagicMock()
-        analyzer._cloner.list_files_in_dir = MagicMock(return_value=[])
-        analyzer._cloner.read_file = MagicMock(return_value="def foo(): pass")
-
-        # Patch gather_code_samples to return code
-        with patch("repo_inspector.analyzer.gather_code_samples", return_value="def foo(): pass"):
-            folders = [
-                FolderAnalysis(path="src", file_count=5, total_lines=100, languages=["Python"]),
-            ]
-            report = await analyzer._analyze_code_llm("owner", "repo", folders)
-            assert report.total_findings >= 1
-            assert report.security_findings >= 1
-
-    @pytest.mark.asyncio
-    async def test_skips_empty_folders(self):
+        analyzer._ask_llm = _async_return(_CODE_LLM_JSON)
+        monkeypatch.setattr(
+            "repo_inspector.analyzer.gather_code_samples", _return("def foo(): pass")
+        )
+
+        folders = [src_folder_analysis]
+        report = await analyzer._analyze_code_llm("owner", "repo", folders)
+        assert report.total_findings >= 1
+        assert report.security_findings >= 1
+
+    async def test_skips_empty_folders(self, monkeypatch):
         analyzer = Analyzer(token="test")
-        analyzer._ask_llm = AsyncMock(return_value="Summary")
+        monkeypatch.setattr("repo_inspector.analyzer.gather_code_samples", _return(""))
 
-        with patch("repo_inspector.analyzer.gather_code_samples", return_value=""):
-            folders = [
-                FolderAnalysis(path="empty", file_count=0, total_lines=0),
-            ]
-            report = await analyzer._analyze_code_llm("owner", "repo", folders)
-            assert report.total_findings == 0
+        folders = [
+            FolderAnalysis(path="empty", file_count=0, total_lines=0),
+        ]
+        report = await analyzer._analyze_code_llm("owner", "repo", folders)
+        assert report.total_findings == 0
 
 
 class TestRunTimeMachine:
-    @pytest.mark.asyncio
-    async def test_compares_periods(self):
-        from repo_inspector.models import Commit, PullRequest, Issue
-
-        analyzer = Analyzer(token="test")
-        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        until = datetime(2025, 2, 1, tzinfo=timezone.utc)
-        tf = Timeframe(since=since, until=until)
+    async def test_compares_periods(self, analyzer, monkeypatch, alice_stats):
+        from repo_inspector.models import Commit
 
         old_commits = [
             Commit(
@@ -623,44 +604,38 @@ class TestRunTimeMachine:
                 files_changed=["src/old.py"],
             ),
         ]
-        analyzer._fetcher.fetch_commits = AsyncMock(return_value=old_commits)
-        analyzer._fetcher.fetch_pull_requests = AsyncMock(return_value=[])
-        analyzer._fetcher.fetch_issues = AsyncMock(return_value=[])
-        analyzer._ask_llm = AsyncMock(return_value="Time machine summary")
+        monkeypatch.setattr(analyzer._fetcher, "fetch_commits", _async_return(old_commits))
+        monkeypatch.setattr(analyzer._fetcher, "fetch_pull_requests", _async_return([]))
+        monkeypatch.setattr(analyzer._fetcher, "fetch_issues", _async_return([]))
+        monkeypatch.setattr(analyzer, "_ask_llm", _async_return("Time machine summary"))
 
         current_result = InspectionResult(
-            repo="owner/repo", timeframe=tf,
+            repo="owner/repo", timeframe=_TF,
             people=PeopleReport(
                 total_contributors=1,
-                stats=[ContributorStats(login="alice", commit_count=10)],
+                stats=[alice_stats],
                 bus_factor=1,
             ),
             code=CodeReport(total_findings=3),
         )
 
         report = await analyzer._run_time_machine(
-            "owner", "repo", current_result, tf, since, until
+            "owner", "repo", current_result, _TF, _SINCE, _UNTIL
         )
         assert report.llm_summary == "Time machine summary"
         assert report.old_timeframe is not None
-        assert report.new_timeframe == tf
-
-    @pytest.mark.asyncio
-    async def test_handles_fetch_error(self):
-        analyzer = Analyzer(token="test")
-        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
-        until = datetime(2025, 2, 1, tzinfo=timezone.utc)
-        tf = Timeframe(since=since, until=until)
+        assert report.new_timeframe == _TF
 
-        analyzer._fetcher.fetch_commits = AsyncMock(side_effect=Exception("API error"))
+    async def test_handles_fetch_error(self, analyzer, monkeypatch):
+        monkeypatch.setattr(analyzer._fetcher, "fetch_commits", _async_raise(Exception("API error")))
 
         current_result = InspectionResult(
-            repo="owner/repo", timeframe=tf,
+            repo="owner/repo", timeframe=_TF,
             people=PeopleReport(bus_factor=1),
             code=CodeReport(),
         )
 
         report = await analyzer._run_time_machine(
-            "owner", "repo", current_result, tf, since, until
+            "owner", "repo", current_result, _TF, _SINCE, _UNTIL
         )
         assert "Could not fetch" in report.llm_summary
@@ -0,0 +1,62 @@
+"""Tests for app.py — lifetime of the app-owned GitHub fetcher."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from repo_inspector.app import RepoInspectorApp
+
+
+def _fake_fetcher() -> MagicMock:
+    fetcher = MagicMock()
+    fetcher.fetch_rate_limit = AsyncMock(return_value={})
+    fetcher.close = AsyncMock()
+    return fetcher
+
+
+class TestAppFetcher:
+    async def test_created_and_warmed_up_on_mount(self):
+        fetcher = _fake_fetcher()
+        with patch("repo_inspector.app.GitHubFetcher", return_value=fetcher) as cls:
+            async with RepoInspectorApp().run_test() as pilot:
+                await pilot.app.workers.wait_for_complete()
+                assert pilot.app.fetcher is fetcher
+                cls.assert_called_once()
+                fetcher.fetch_rate_limit.assert_awaited_once()
+                fetcher.close.assert_not_called()
+
+    async def test_closed_on_unmount(self):
+        fetcher = _fake_fetcher()
+        with patch("repo_inspector.app.GitHubFetcher", return_value=fetcher):
+            async with RepoInspectorApp().run_test():
+                pass
+        fetcher.close.assert_awaited_once()
+
+    async def test_warm_up_failure_is_not_fatal(self):
+        fetcher = _fake_fetcher()
+        fetcher.fetch_rate_limit.side_effect = httpx.ConnectError("offline")
+        with patch("repo_inspector.app.GitHubFetcher", return_value=fetcher):
+            async with RepoInspectorApp().run_test() as pilot:
+                await pilot.app.workers.wait_for_complete()
+                assert pilot.app.is_running
+
+    async def test_inspection_borrows_the_app_fetcher(self):
+        fetcher = _fake_fetcher()
+        analyzer = MagicMock()
+        analyzer.inspect = AsyncMock(return_value=MagicMock())
+        analyzer.close = AsyncMock()
+        with (
+            patch("repo_inspector.app.GitHubFetcher", return_value=fetcher),
+            patch("repo_inspector.app.Analyzer", return_value=analyzer) as cls,
+            patch.object(RepoInspectorApp, "_show_results"),
+        ):
+            async with RepoInspectorApp().run_test() as pilot:
+                pilot.app.run_inspection(
+                    "o", "r", datetime(2024, 1, 1, tzinfo=timezone.utc)
+                )
+                await pilot.pause()
+                await pilot.app.workers.wait_for_complete()
+                assert cls.call_args.kwargs["fetcher"] is fetcher
+                analyzer.close.assert_awaited_once()
+                fetcher.close.assert_not_called()
@@ -8,10 +8,11 @@ from repo_inspector.analysis.bus_mitigation import build_bus_mitigation
 from repo_inspector.models import Commit, ContributorStats
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bm_commits():
+    # Shared across the module: a tuple so no test can mutate it.
     base = datetime(2025, 1, 15, tzinfo=timezone.utc)
-    return [
+    return (
         Commit(
             sha="a1", message="work", author_name="Alice",
             author_login="alice", date=base,
@@ -25,33 +26,27 @@ def bm_commits():
             url="https://github.com/o/r/commit/b1",
             files_changed=["tests/test_auth.py"],
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bm_stats():
-    return [
+    return (
         ContributorStats(login="alice", commit_count=50),
         ContributorStats(login="bob", commit_count=5),
-    ]
+    )
 
 
 class TestBuildBusMitigation:
-    def test_critical_risk(self, bm_stats, bm_commits):
-        report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=1)
-        assert report.risk_level == "critical"
-
-    def test_high_risk(self, bm_stats, bm_commits):
-        report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=2)
-        assert report.risk_level == "high"
-
-    def test_medium_risk(self, bm_stats, bm_commits):
-        report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=3)
-        assert report.risk_level == "medium"
-
-    def test_low_risk(self, bm_stats, bm_commits):
-        report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=5)
-        assert report.risk_level == "low"
+    @pytest.mark.parametrize("bus_factor,expected", [
+        (1, "critical"),
+        (2, "high"),
+        (3, "medium"),
+        (5, "low"),
+    ])
+    def test_risk_level(self, bm_stats, bm_commits, bus_factor, expected):
+        report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=bus_factor)
+        assert report.risk_level == expected
 
     def test_finds_exclusive_files(self, bm_stats, bm_commits):
         report = build_bus_mitigation(bm_stats, bm_commits, bus_factor=1)
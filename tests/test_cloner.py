@@ -1,39 +1,64 @@
 """Tests for the cloner module."""
 
 import json
-import os
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import git
 import pytest
 
 from repo_inspector.cloner import RepoCloner, _human_size
 
+# Fake clone layout shared by the read-only tests: empty dirs, then files
+# (pre-encoded so seeding a tree is just one write per file).
+_TREE_DIRS = ("src", "tests", "docs", ".git", "__pycache__")
+_TREE_FILES = (
+    ("README.md", b"# Hello\n"),
+    ("src/main.py", b"print('hello')\nimport os\n"),
+    ("src/utils.py", b"def helper():\n    pass\n"),
+    ("src/.hidden", b"secret"),
+    ("tests/test_main.py", b"def test_one():\n    assert True\n"),
+    ("docs/guide.md", b"# Guide\n\nSome docs.\n"),
+)
 
-@pytest.fixture
-def cloner_with_dir(tmp_path):
-    """Create a RepoCloner with a fake clone directory."""
-    cloner = RepoCloner(token="test-token")
-    cloner._clone_dir = tmp_path
-
-    # Create some directories and files
-    (tmp_path / "src").mkdir()
-    (tmp_path / "tests").mkdir()
-    (tmp_path / "docs").mkdir()
-    (tmp_path / ".git").mkdir()
-    (tmp_path / "__pycache__").mkdir()
-
-    (tmp_path / "README.md").write_text("# Hello\n")
-    (tmp_path / "src" / "main.py").write_text("print('hello')\nimport os\n")
-    (tmp_path / "src" / "utils.py").write_text("def helper():\n    pass\n")
-    (tmp_path / "src" / ".hidden").write_text("secret")
-    (tmp_path / "tests" / "test_main.py").write_text("def test_one():\n    assert True\n")
-    (tmp_path / "docs" / "guide.md").write_text("# Guide\n\nSome docs.\n")
+_LONG_FILE = "\n".join(f"line {i}" for i in range(1000)).encode()
+
+
+def _seed_tree(base: Path) -> None:
+    for d in _TREE_DIRS:
+        (base / d).mkdir(parents=True, exist_ok=True)
+    for rel, content in _TREE_FILES:
+        (base / rel).write_bytes(content)
 
+
+def _cloner_at(path: Path) -> RepoCloner:
+    cloner = RepoCloner(token="test-token")
+    cloner._clone_dir = path
     return cloner
 
 
+@pytest.fixture(scope="module")
+def cloner_with_dir(tmp_path_factory):
+    """A RepoCloner over a fake clone built once per module; tests must not write to it."""
+    base = tmp_path_factory.mktemp("cloner_repo")
+    _seed_tree(base)
+    return _cloner_at(base)
+
+
+@pytest.fixture(scope="module")
+def empty_cloner():
+    """A RepoCloner that has not cloned anything."""
+    return RepoCloner()
+
+
+@pytest.fixture
+def writable_cloner(tmp_path):
+    """A RepoCloner over a private copy of the fake clone, rooted at ``tmp_path``."""
+    _seed_tree(tmp_path)
+    return _cloner_at(tmp_path)
+
+
 class TestRepoCloner:
     def test_init_with_token(self):
         cloner = RepoCloner(token="my-token")
@@ -75,10 +100,8 @@ class TestRepoCloner:
     @patch("repo_inspector.cloner.git.Repo.clone_from")
     def test_clone_saml_fallback(self, mock_clone):
         """Auth clone fails, retry without token succeeds."""
-        import git as gitmodule
-
         mock_clone.side_effect = [
-            gitmodule.exc.GitCommandError("clone", "SAML"),
+            git.exc.GitCommandError("clone", "SAML"),
             MagicMock(),
         ]
         cloner = RepoCloner(token="test-token")
@@ -110,9 +133,8 @@ class TestListTopLevelDirs:
         assert ".git" not in dirs
         assert "__pycache__" not in dirs
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.list_top_level_dirs() == []
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.list_top_level_dirs() == []
 
 
 class TestListFilesInDir:
@@ -135,9 +157,8 @@ class TestListFilesInDir:
         files = cloner_with_dir.list_files_in_dir("nonexistent")
         assert files == []
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.list_files_in_dir("src") == []
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.list_files_in_dir("src") == []
 
 
 class TestReadFile:
@@ -145,18 +166,16 @@ class TestReadFile:
         content = cloner_with_dir.read_file("src/main.py")
         assert "print" in content
 
-    def test_truncates_long_file(self, cloner_with_dir, tmp_path):
-        long_content = "\n".join(f"line {i}" for i in range(1000))
-        (tmp_path / "src" / "long.py").write_text(long_content)
-        content = cloner_with_dir.read_file("src/long.py", max_lines=10)
+    def test_truncates_long_file(self, writable_cloner, tmp_path):
+        (tmp_path / "src" / "long.py").write_bytes(_LONG_FILE)
+        content = writable_cloner.read_file("src/long.py", max_lines=10)
         assert "truncated" in content
 
     def test_nonexistent_file(self, cloner_with_dir):
         assert cloner_with_dir.read_file("nofile.py") == ""
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.read_file("any.py") == ""
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.read_file("any.py") == ""
 
 
 class TestGetTreeSummary:
@@ -165,9 +184,8 @@ class TestGetTreeSummary:
         assert "src/" in tree
         assert "main.py" in tree
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.get_tree_summary() == ""
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.get_tree_summary() == ""
 
 
 class TestFolderStats:
@@ -180,9 +198,8 @@ class TestFolderStats:
         stats = cloner_with_dir.folder_stats("nonexistent")
         assert stats == {"files": 0, "lines": 0}
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.folder_stats("src") == {"files": 0, "lines": 0}
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.folder_stats("src") == {"files": 0, "lines": 0}
 
 
 class TestDetectLanguages:
@@ -194,131 +211,126 @@ class TestDetectLanguages:
         langs = cloner_with_dir.detect_languages("docs")
         assert "Markdown" in langs
 
-    def test_detects_dockerfile(self, cloner_with_dir, tmp_path):
+    def test_detects_dockerfile(self, writable_cloner, tmp_path):
         (tmp_path / "infra").mkdir()
         (tmp_path / "infra" / "Dockerfile").write_text("FROM python:3.11\n")
-        langs = cloner_with_dir.detect_languages("infra")
+        langs = writable_cloner.detect_languages("infra")
         assert "Docker" in langs
 
-    def test_detects_multiple_languages(self, cloner_with_dir, tmp_path):
+    def test_detects_multiple_languages(self, writable_cloner, tmp_path):
         (tmp_path / "src" / "app.js").write_text("console.log('hi')")
-        langs = cloner_with_dir.detect_languages("src")
+        langs = writable_cloner.detect_languages("src")
         assert "Python" in langs
         assert "JavaScript" in langs
 
     def test_nonexistent_dir(self, cloner_with_dir):
         assert cloner_with_dir.detect_languages("nonexistent") == []
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.detect_languages("src") == []
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.detect_languages("src") == []
 
 
 class TestDetectDependencyFiles:
-    def test_finds_requirements(self, cloner_with_dir, tmp_path):
+    def test_finds_requirements(self, writable_cloner, tmp_path):
         (tmp_path / "requirements.txt").write_text("flask>=2.0\n")
-        result = cloner_with_dir.detect_dependency_files()
+        result = writable_cloner.detect_dependency_files()
         assert "requirements.txt" in result
         assert result["requirements.txt"] == "python"
 
-    def test_finds_package_json(self, cloner_with_dir, tmp_path):
+    def test_finds_package_json(self, writable_cloner, tmp_path):
         (tmp_path / "package.json").write_text('{"name": "test"}')
-        result = cloner_with_dir.detect_dependency_files()
+        result = writable_cloner.detect_dependency_files()
         assert "package.json" in result
         assert result["package.json"] == "npm"
 
-    def test_finds_cargo_toml(self, cloner_with_dir, tmp_path):
+    def test_finds_cargo_toml(self, writable_cloner, tmp_path):
         (tmp_path / "Cargo.toml").write_text('[package]\nname = "test"')
-        result = cloner_with_dir.detect_dependency_files()
+        result = writable_cloner.detect_dependency_files()
         assert "Cargo.toml" in result
         assert result["Cargo.toml"] == "rust"
 
-    def test_finds_csproj(self, cloner_with_dir, tmp_path):
+    def test_finds_csproj(self, writable_cloner, tmp_path):
         (tmp_path / "MyApp.csproj").write_text("<Project></Project>")
-        result = cloner_with_dir.detect_dependency_files()
+        result = writable_cloner.detect_dependency_files()
         assert "MyApp.csproj" in result
         assert result["MyApp.csproj"] == "dotnet"
 
-    def test_no_clone_dir(self):
-        cloner = RepoCloner()
-        assert cloner.detect_dependency_files() == {}
+    def test_no_clone_dir(self, empty_cloner):
+        assert empty_cloner.detect_dependency_files() == {}
+
+
+# Manifest fixtures for the parser tests, serialized once.
+_PACKAGE_JSON = json.dumps({
+    "name": "test",
+    "dependencies": {"express": "^4.18.0"},
+    "devDependencies": {"jest": "^29.0.0"},
+}).encode()
+_GO_MOD = b"module example.com/test\n\nrequire (\n\tgithub.com/gin-gonic/gin v1.9.1\n)\n"
+_CARGO_TOML = b'[package]\nname = "test"\n\n[dependencies]\nserde = "1.0"\n'
+_PYPROJECT_TOML = (
+    b'[project]\nname = "myproject"\ndependencies = [\n  "click>=8.0",\n  "httpx>=0.24",\n]\n'
+)
 
 
 class TestParseDependencies:
-    def test_parses_requirements_txt(self, cloner_with_dir, tmp_path):
+    def test_parses_requirements_txt(self, writable_cloner, tmp_path):
         (tmp_path / "requirements.txt").write_text("flask>=2.0\nrequests==2.28.0\n# comment\n")
-        deps = cloner_with_dir.parse_dependencies()
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "flask" in names
         assert "requests" in names
 
-    def test_parses_package_json(self, cloner_with_dir, tmp_path):
-        pkg = {
-            "name": "test",
-            "dependencies": {"express": "^4.18.0"},
-            "devDependencies": {"jest": "^29.0.0"},
-        }
-        (tmp_path / "package.json").write_text(json.dumps(pkg))
-        deps = cloner_with_dir.parse_dependencies()
+    def test_parses_package_json(self, writable_cloner, tmp_path):
+        (tmp_path / "package.json").write_bytes(_PACKAGE_JSON)
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "express" in names
         assert "jest" in names
 
-    def test_parses_go_mod(self, cloner_with_dir, tmp_path):
-        (tmp_path / "go.mod").write_text(
-            "module example.com/test\n\nrequire (\n\tgithub.com/gin-gonic/gin v1.9.1\n)\n"
-        )
-        deps = cloner_with_dir.parse_dependencies()
+    def test_parses_go_mod(self, writable_cloner, tmp_path):
+        (tmp_path / "go.mod").write_bytes(_GO_MOD)
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "github.com/gin-gonic/gin" in names
 
-    def test_parses_cargo_toml(self, cloner_with_dir, tmp_path):
-        (tmp_path / "Cargo.toml").write_text(
-            '[package]\nname = "test"\n\n[dependencies]\nserde = "1.0"\n'
-        )
-        deps = cloner_with_dir.parse_dependencies()
+    def test_parses_cargo_toml(self, writable_cloner, tmp_path):
+        (tmp_path / "Cargo.toml").write_bytes(_CARGO_TOML)
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "serde" in names
 
-    def test_parses_pyproject_toml(self, cloner_with_dir, tmp_path):
-        (tmp_path / "pyproject.toml").write_text(
-            '[project]\nname = "myproject"\ndependencies = [\n  "click>=8.0",\n  "httpx>=0.24",\n]\n'
-        )
-        deps = cloner_with_dir.parse_dependencies()
+    def test_parses_pyproject_toml(self, writable_cloner, tmp_path):
+        (tmp_path / "pyproject.toml").write_bytes(_PYPROJECT_TOML)
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "click" in names or "httpx" in names
 
-    def test_invalid_package_json(self, cloner_with_dir, tmp_path):
+    def test_invalid_package_json(self, writable_cloner, tmp_path):
         (tmp_path / "package.json").write_text("not valid json {{{")
-        deps = cloner_with_dir.parse_dependencies()
+        deps = writable_cloner.parse_dependencies()
         # Should not crash, just skip
         pkg_deps = [d for d in deps if d.get("ecosystem") == "npm"]
         assert pkg_deps == []
 
-    def test_requirements_skips_flags(self, cloner_with_dir, tmp_path):
+    def test_requirements_skips_flags(self, writable_cloner, tmp_path):
         (tmp_path / "requirements.txt").write_text("-r base.txt\n-e .\nflask>=2.0\n")
-        deps = cloner_with_dir.parse_dependencies()
+        deps = writable_cloner.parse_dependencies()
         names = [d["name"] for d in deps]
         assert "flask" in names
         # -r and -e lines should be skipped
         assert "-r" not in names
 
     def test_no_deps_found(self, cloner_with_dir):
-        deps = cloner_with_dir.parse_dependencies()
-        # may find pyproject.toml or nothing depending on fixture
-        assert isinstance(deps, list)
+        # The shared tree is never written to, so it has no manifests.
+        assert cloner_with_dir.parse_dependencies() == []
 
 
 class TestHumanSize:
-    def test_bytes(self):
-        assert _human_size(500) == "500B"
-
-    def test_kilobytes(self):
-        assert _human_size(2048) == "2KB"
-
-    def test_megabytes(self):
-        assert _human_size(1048576) == "1MB"
-
-    def test_gigabytes(self):
-        result = _human_size(2 * 1024 * 1024 * 1024)
-        assert "GB" in result
+    @pytest.mark.parametrize("size,expected", [
+        (500, "500B"),
+        (2048, "2KB"),
+        (1048576, "1MB"),
+        (2 * 1024 * 1024 * 1024, "2.0GB"),
+    ], ids=["bytes", "kilobytes", "megabytes", "gigabytes"])
+    def test_human_size(self, size, expected):
+        assert _human_size(size) == expected
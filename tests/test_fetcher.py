@@ -1,17 +1,112 @@
 """Tests for the fetcher module."""
 
+import json
 from datetime import datetime, timezone
 
 import httpx
 import pytest
+import pytest_asyncio
 import respx
 
 from repo_inspector.fetcher import GitHubFetcher
-
-
-@pytest.fixture
-def github_fetcher():
-    return GitHubFetcher(token="test-token")
+from tests.helpers import json_response
+
+
+@pytest.fixture(scope="module")
+def github_api():
+    """respx router with the repo endpoints registered once; tests set each route's response."""
+    router = respx.Router(assert_all_called=False)
+    for name, path in (("commits", "/commits"), ("pulls", "/pulls"),
+                       ("issues", "/issues"), ("repo", "")):
+        router.get(f"https://api.github.com/repos/owner/repo{path}", name=name)
+    return router
+
+
+@pytest_asyncio.fixture(scope="module")
+async def github_fetcher(github_api):
+    """One fetcher shared by the module, its client wired straight to the respx router.
+
+    A MockTransport hands requests to the router directly, so there is no
+    connection pool and no global transport patching.
+    """
+    fetcher = GitHubFetcher(token="test-token")
+    await fetcher.close()
+    fetcher._client = httpx.AsyncClient(
+        base_url=fetcher.base_url,
+        headers=fetcher.headers,
+        transport=httpx.MockTransport(github_api.async_handler),
+    )
+    yield fetcher
+    await fetcher.close()
+
+
+# Canned API payloads, encoded once; responses carry the raw bytes.
+_COMMITS_BODY = json.dumps([
+    {
+        "sha": "abc123def456",
+        "commit": {
+            "message": "Test commit",
+            "author": {
+                "name": "Test Author",
+                "email": "dev@test.com",
+                "date": "2025-01-15T10:00:00Z",
+            },
+        },
+        "author": {"login": "testuser"},
+        "html_url": "https://github.com/owner/repo/commit/abc123def456",
+    }
+]).encode()
+
+_PULLS_BODY = json.dumps([
+    {
+        "number": 1,
+        "title": "Test PR",
+        "body": "Test body",
+        "user": {"login": "testuser"},
+        "created_at": "2025-01-10T00:00:00Z",
+        "updated_at": "2025-01-15T00:00:00Z",
+        "merged_at": "2025-01-12T00:00:00Z",
+        "closed_at": None,
+        "html_url": "https://github.com/owner/repo/pull/1",
+        "labels": [{"name": "enhancement"}],
+        "additions": 100,
+        "deletions": 20,
+        "changed_files": 5,
+    }
+]).encode()
+
+_ISSUES_BODY = json.dumps([
+    {
+        "number": 5,
+        "title": "Bug report",
+        "body": "Something broke",
+        "user": {"login": "reporter"},
+        "state": "open",
+        "created_at": "2025-01-10T00:00:00Z",
+        "updated_at": "2025-01-15T00:00:00Z",
+        "closed_at": None,
+        "html_url": "https://github.com/owner/repo/issues/5",
+        "labels": [],
+    },
+    {
+        "number": 6,
+        "title": "PR disguised as issue",
+        "user": {"login": "dev"},
+        "state": "closed",
+        "created_at": "2025-01-10T00:00:00Z",
+        "updated_at": "2025-01-15T00:00:00Z",
+        "closed_at": "2025-01-12T00:00:00Z",
+        "html_url": "https://github.com/owner/repo/issues/6",
+        "labels": [],
+        "pull_request": {"url": "..."},
+    },
+]).encode()
+
+_REPO_BODY = json.dumps({
+    "name": "repo",
+    "description": "A test repo",
+    "topics": ["python", "cli"],
+}).encode()
 
 
 class TestGitHubFetcher:
@@ -28,119 +123,36 @@ class TestGitHubFetcher:
     def test_headers_include_api_version(self, github_fetcher):
         assert "X-GitHub-Api-Version" in github_fetcher.headers
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_commits(self, github_fetcher):
-        mock_commits = [
-            {
-                "sha": "abc123def456",
-                "commit": {
-                    "message": "Test commit",
-                    "author": {
-                        "name": "Test Author",
-                        "email": "dev@test.com",
-                        "date": "2025-01-15T10:00:00Z",
-                    },
-                },
-                "author": {"login": "testuser"},
-                "html_url": "https://github.com/owner/repo/commit/abc123def456",
-            }
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/commits").mock(
-            return_value=httpx.Response(200, json=mock_commits)
-        )
+    async def test_fetch_commits(self, github_fetcher, github_api):
+        github_api["commits"].return_value = json_response(_COMMITS_BODY)
         since = datetime(2025, 1, 1, tzinfo=timezone.utc)
         until = datetime(2025, 2, 1, tzinfo=timezone.utc)
         commits = await github_fetcher.fetch_commits("owner", "repo", since, until)
-        await github_fetcher.close()
 
         assert len(commits) == 1
         assert commits[0].sha == "abc123def456"
         assert commits[0].author_login == "testuser"
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_pull_requests(self, github_fetcher):
-        mock_prs = [
-            {
-                "number": 1,
-                "title": "Test PR",
-                "body": "Test body",
-                "user": {"login": "testuser"},
-                "created_at": "2025-01-10T00:00:00Z",
-                "updated_at": "2025-01-15T00:00:00Z",
-                "merged_at": "2025-01-12T00:00:00Z",
-                "closed_at": None,
-                "html_url": "https://github.com/owner/repo/pull/1",
-                "labels": [{"name": "enhancement"}],
-                "additions": 100,
-                "deletions": 20,
-                "changed_files": 5,
-            }
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/pulls").mock(
-            return_value=httpx.Response(200, json=mock_prs)
-        )
+    async def test_fetch_pull_requests(self, github_fetcher, github_api):
+        github_api["pulls"].return_value = json_response(_PULLS_BODY)
         since = datetime(2025, 1, 1, tzinfo=timezone.utc)
         until = datetime(2025, 2, 1, tzinfo=timezone.utc)
         prs = await github_fetcher.fetch_pull_requests("owner", "repo", since, until)
-        await github_fetcher.close()
 
         assert len(prs) == 1
         assert prs[0].number == 1
         assert "enhancement" in prs[0].labels
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_issues_excludes_prs(self, github_fetcher):
-        mock_issues = [
-            {
-                "number": 5,
-                "title": "Bug report",
-                "body": "Something broke",
-                "user": {"login": "reporter"},
-                "state": "open",
-                "created_at": "2025-01-10T00:00:00Z",
-                "updated_at": "2025-01-15T00:00:00Z",
-                "closed_at": None,
-                "html_url": "https://github.com/owner/repo/issues/5",
-                "labels": [],
-            },
-            {
-                "number": 6,
-                "title": "PR disguised as issue",
-                "user": {"login": "dev"},
-                "state": "closed",
-                "created_at": "2025-01-10T00:00:00Z",
-                "updated_at": "2025-01-15T00:00:00Z",
-                "closed_at": "2025-01-12T00:00:00Z",
-                "html_url": "https://github.com/owner/repo/issues/6",
-                "labels": [],
-                "pull_request": {"url": "..."},
-            },
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/issues").mock(
-            return_value=httpx.Response(200, json=mock_issues)
-        )
+    async def test_fetch_issues_excludes_prs(self, github_fetcher, github_api):
+        github_api["issues"].return_value = json_response(_ISSUES_BODY)
         since = datetime(2025, 1, 1, tzinfo=timezone.utc)
         issues = await github_fetcher.fetch_issues("owner", "repo", since)
-        await github_fetcher.close()
 
         assert len(issues) == 1
         assert issues[0].number == 5
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_repo_info(self, github_fetcher):
-        mock_info = {
-            "name": "repo",
-            "description": "A test repo",
-            "topics": ["python", "cli"],
-        }
-        respx.get("https://api.github.com/repos/owner/repo").mock(
-            return_value=httpx.Response(200, json=mock_info)
-        )
+    async def test_fetch_repo_info(self, github_fetcher, github_api):
+        github_api["repo"].return_value = json_response(_REPO_BODY)
         info = await github_fetcher.fetch_repo_info("owner", "repo")
-        await github_fetcher.close()
 
         assert info["description"] == "A test repo"
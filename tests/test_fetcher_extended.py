@@ -1,39 +1,134 @@
 """Extended tests for the fetcher module — covering additional branches."""
 
+import json
 from datetime import datetime, timezone
 
 import httpx
 import pytest
+import pytest_asyncio
 import respx
 
 from repo_inspector.fetcher import GitHubFetcher
+from tests.helpers import json_response
+
+# Route URLs, parsed once at import.
+_REPO = httpx.URL("https://api.github.com/repos/owner/repo")
+_BRANCHES = httpx.URL(f"{_REPO}/branches")
+_COMMITS = httpx.URL(f"{_REPO}/commits")
+_COMMIT_DETAIL = httpx.URL(f"{_REPO}/commits/abc123")
+_ISSUES = httpx.URL(f"{_REPO}/issues")
+_PR_REVIEWS = httpx.URL(f"{_REPO}/pulls/1/reviews")
+_PR_REVIEW_COMMENTS = httpx.URL(f"{_REPO}/pulls/1/comments")
+_README = httpx.URL(f"{_REPO}/readme")
+_RATE_LIMIT = httpx.URL("https://api.github.com/rate_limit")
+
+# Canned payloads, encoded once; responses carry the raw bytes.
+_REPO_INFO_BODY = b'{"name": "repo"}'
+
+_BRANCHES_BODY = json.dumps([
+    {"name": "main", "commit": {"sha": "abc123"}},
+    {"name": "feature-x", "commit": {"sha": "def456"}},
+]).encode()
+
+_REVIEWS_BODY = json.dumps([
+    {"id": 1, "user": {"login": "reviewer"}, "state": "APPROVED"},
+]).encode()
+
+_REVIEW_COMMENTS_BODY = json.dumps([
+    {"id": 1, "body": "Looks good", "user": {"login": "reviewer"}},
+]).encode()
+
+_UNLABELLED_ISSUES_BODY = json.dumps([
+    {
+        "number": 7,
+        "title": "No labels",
+        "user": {"login": "reporter"},
+        "state": "open",
+        "created_at": "2025-01-10T00:00:00Z",
+        "html_url": "https://github.com/owner/repo/issues/7",
+    },
+    {
+        "number": 8,
+        "title": "Labelled",
+        "user": {"login": "reporter"},
+        "state": "open",
+        "created_at": "2025-01-10T00:00:00Z",
+        "html_url": "https://github.com/owner/repo/issues/8",
+        "labels": [{"name": "bug"}, {"name": "ui"}],
+    },
+]).encode()
+
+_COMMIT_DETAIL_BODY = json.dumps({
+    "sha": "abc123",
+    "stats": {"additions": 50, "deletions": 10},
+    "files": [{"filename": "src/main.py", "status": "modified"}],
+}).encode()
+
+_RATE_LIMIT_BODY = json.dumps({"resources": {"core": {"limit": 5000, "remaining": 4999}}}).encode()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def github_fetcher():
+    """Fetcher shared by every test in the module; closed clients are rebuilt lazily."""
+    fetcher = GitHubFetcher(token="test-token")
+    yield fetcher
+    await fetcher.close()
+
+
+@pytest_asyncio.fixture
+async def canned_fetcher(request):
+    """Fetcher whose client answers every request with the JSON body in ``request.param``.
+
+    For tests that don't care which URL was hit: a bare MockTransport skips
+    respx route matching altogether.
+    """
+    body = request.param
+    fetcher = GitHubFetcher(token="test-token")
+    await fetcher.close()
+    fetcher._client = httpx.AsyncClient(
+        base_url=fetcher.base_url,
+        transport=httpx.MockTransport(lambda _request: json_response(body)),
+    )
+    yield fetcher
+    await fetcher.close()
+
+
+@pytest.fixture(scope="module")
+def _api_router():
+    with respx.mock(assert_all_called=False) as router:
+        yield router
 
 
 @pytest.fixture
-def github_fetcher():
-    return GitHubFetcher(token="test-token")
+def api(_api_router):
+    """Module-wide respx router; each test registers its routes and they are cleared after."""
+    yield _api_router
+    _api_router.clear()
+    _api_router.reset()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _restore_shared_auth(github_fetcher):
+    """Undo any SAML fallback a test leaves on the shared fetcher."""
+    yield
+    await github_fetcher.restore_auth()
 
 
 class TestSamlFallback:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_get_saml_fallback(self, github_fetcher):
+    async def test_get_saml_fallback(self, github_fetcher, api):
         """Test that SAML 403 triggers auth removal and retry."""
-        route = respx.get("https://api.github.com/repos/owner/repo")
+        route = api.get(_REPO)
         route.side_effect = [
             httpx.Response(403, text="Organization requires SAML authentication"),
-            httpx.Response(200, json={"name": "repo"}),
+            json_response(_REPO_INFO_BODY),
         ]
         result = await github_fetcher.fetch_repo_info("owner", "repo")
-        await github_fetcher.close()
         assert result["name"] == "repo"
         assert github_fetcher.is_unauthenticated is True
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_rate_limit_error(self, github_fetcher):
+    async def test_rate_limit_error(self, github_fetcher, api):
         """Test that rate limit 403 raises an exception."""
-        respx.get("https://api.github.com/repos/owner/repo").mock(
+        api.get(_REPO).mock(
             return_value=httpx.Response(
                 403,
                 text="API rate limit exceeded",
@@ -45,7 +140,19 @@ class TestSamlFallback:
         )
         with pytest.raises(httpx.HTTPStatusError, match="rate limit"):
             await github_fetcher.fetch_repo_info("owner", "repo")
-        await github_fetcher.close()
+
+    async def test_restore_auth_after_saml_fallback(self, github_fetcher, api):
+        route = api.get(_REPO)
+        route.side_effect = [
+            httpx.Response(403, text="Organization requires SAML authentication"),
+            json_response(_REPO_INFO_BODY),
+        ]
+        await github_fetcher.fetch_repo_info("owner", "repo")
+        assert github_fetcher.is_unauthenticated is True
+
+        await github_fetcher.restore_auth()
+        assert github_fetcher.is_unauthenticated is False
+        assert "Authorization" in github_fetcher.headers
 
 
 class TestIsUnauthenticated:
@@ -59,204 +166,148 @@ class TestIsUnauthenticated:
 
 
 class TestFetchBranches:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_branches(self, github_fetcher):
-        mock_branches = [
-            {"name": "main", "commit": {"sha": "abc123"}},
-            {"name": "feature-x", "commit": {"sha": "def456"}},
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/branches").mock(
-            return_value=httpx.Response(200, json=mock_branches)
-        )
+    async def test_fetch_branches(self, github_fetcher, api):
+        api.get(_BRANCHES).mock(return_value=json_response(_BRANCHES_BODY))
         branches = await github_fetcher.fetch_branches("owner", "repo")
-        await github_fetcher.close()
         assert len(branches) == 2
         assert branches[0]["name"] == "main"
 
 
 class TestFetchBranchCompare:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_compare_branches(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo/compare/main...feature").mock(
-            return_value=httpx.Response(200, json={"ahead_by": 3, "behind_by": 1})
-        )
-        result = await github_fetcher.fetch_branch_compare("owner", "repo", "main", "feature")
-        await github_fetcher.close()
-        assert result["ahead_by"] == 3
-        assert result["behind_by"] == 1
-
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_compare_branches_404(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo/compare/main...gone").mock(
-            return_value=httpx.Response(404)
-        )
-        result = await github_fetcher.fetch_branch_compare("owner", "repo", "main", "gone")
-        await github_fetcher.close()
-        assert result == {"ahead_by": 0, "behind_by": 0}
+    @pytest.mark.parametrize("head,response,expected", [
+        ("feature", json_response(b'{"ahead_by": 3, "behind_by": 1}'),
+         {"ahead_by": 3, "behind_by": 1}),
+        ("gone", httpx.Response(404), {"ahead_by": 0, "behind_by": 0}),
+    ], ids=["compare", "not_found"])
+    async def test_compare_branches(self, github_fetcher, api, head, response, expected):
+        api.get(f"{_REPO}/compare/main...{head}").mock(return_value=response)
+        result = await github_fetcher.fetch_branch_compare("owner", "repo", "main", head)
+        assert result == expected
 
 
 class TestFetchPrReviews:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_reviews(self, github_fetcher):
-        mock_reviews = [
-            {"id": 1, "user": {"login": "reviewer"}, "state": "APPROVED"},
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/pulls/1/reviews").mock(
-            return_value=httpx.Response(200, json=mock_reviews)
-        )
+    async def test_fetch_reviews(self, github_fetcher, api):
+        api.get(_PR_REVIEWS).mock(return_value=json_response(_REVIEWS_BODY))
         reviews = await github_fetcher.fetch_pr_reviews("owner", "repo", 1)
-        await github_fetcher.close()
         assert len(reviews) == 1
         assert reviews[0]["state"] == "APPROVED"
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_review_comments(self, github_fetcher):
-        mock_comments = [
-            {"id": 1, "body": "Looks good", "user": {"login": "reviewer"}},
-        ]
-        respx.get("https://api.github.com/repos/owner/repo/pulls/1/comments").mock(
-            return_value=httpx.Response(200, json=mock_comments)
-        )
+    async def test_fetch_review_comments(self, github_fetcher, api):
+        api.get(_PR_REVIEW_COMMENTS).mock(return_value=json_response(_REVIEW_COMMENTS_BODY))
         comments = await github_fetcher.fetch_pr_review_comments("owner", "repo", 1)
-        await github_fetcher.close()
         assert len(comments) == 1
 
 
-class TestFetchDefaultBranch:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_default_branch(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo").mock(
-            return_value=httpx.Response(200, json={"default_branch": "develop"})
-        )
-        branch = await github_fetcher.fetch_default_branch("owner", "repo")
-        await github_fetcher.close()
-        assert branch == "develop"
+class TestFetchRateLimit:
+    async def test_fetch_rate_limit(self, github_fetcher, api):
+        api.get(_RATE_LIMIT).mock(return_value=json_response(_RATE_LIMIT_BODY))
+        data = await github_fetcher.fetch_rate_limit()
+        assert data["resources"]["core"]["limit"] == 5000
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_default_branch_fallback(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo").mock(
-            return_value=httpx.Response(200, json={})
-        )
-        branch = await github_fetcher.fetch_default_branch("owner", "repo")
-        await github_fetcher.close()
-        assert branch == "main"
 
+class TestLabelExtraction:
+    async def test_missing_labels_key(self, github_fetcher, api):
+        api.get(_ISSUES).mock(return_value=json_response(_UNLABELLED_ISSUES_BODY))
+        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        issues = await github_fetcher.fetch_issues("owner", "repo", since)
+        assert issues[0].labels == []
+        assert issues[1].labels == ["bug", "ui"]
 
-class TestFetchReadme:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_readme(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo/readme").mock(
-            return_value=httpx.Response(200, text="# My Repo\nThis is a test.")
-        )
-        readme = await github_fetcher.fetch_readme("owner", "repo")
-        await github_fetcher.close()
-        assert "My Repo" in readme
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_readme_not_found(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo/readme").mock(
-            return_value=httpx.Response(404)
-        )
+class TestFetchDefaultBranch:
+    @pytest.mark.parametrize("canned_fetcher,expected", [
+        (b'{"default_branch": "develop"}', "develop"),
+        (b"{}", "main"),
+    ], ids=["reported", "fallback"], indirect=["canned_fetcher"])
+    async def test_fetch_default_branch(self, canned_fetcher, expected):
+        branch = await canned_fetcher.fetch_default_branch("owner", "repo")
+        assert branch == expected
+
+
+class TestFetchReadme:
+    @pytest.mark.parametrize("response,expected", [
+        (httpx.Response(200, text="# My Repo\nThis is a test."), "# My Repo\nThis is a test."),
+        (httpx.Response(404), None),
+    ], ids=["found", "not_found"])
+    async def test_fetch_readme(self, github_fetcher, api, response, expected):
+        api.get(_README).mock(return_value=response)
         readme = await github_fetcher.fetch_readme("owner", "repo")
-        await github_fetcher.close()
-        assert readme is None
+        assert readme == expected
 
 
 class TestFetchCommitDetail:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_commit_detail(self, github_fetcher):
-        mock_detail = {
-            "sha": "abc123",
-            "stats": {"additions": 50, "deletions": 10},
-            "files": [{"filename": "src/main.py", "status": "modified"}],
-        }
-        respx.get("https://api.github.com/repos/owner/repo/commits/abc123").mock(
-            return_value=httpx.Response(200, json=mock_detail)
-        )
+    async def test_fetch_commit_detail(self, github_fetcher, api):
+        api.get(_COMMIT_DETAIL).mock(return_value=json_response(_COMMIT_DETAIL_BODY))
         detail = await github_fetcher.fetch_commit_detail("owner", "repo", "abc123")
-        await github_fetcher.close()
         assert detail["stats"]["additions"] == 50
 
 
-class TestPagination:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_paginate_multiple_pages(self, github_fetcher):
-        """Test that pagination fetches multiple pages."""
-        def _make_commit(i):
-            return {
-                "sha": f"commit{i:03d}",
-                "commit": {
-                    "message": f"commit {i}",
-                    "author": {
-                        "name": "Dev",
-                        "email": "dev@test.com",
-                        "date": "2025-01-15T10:00:00Z",
-                    },
-                },
-                "author": {"login": "dev"},
-                "html_url": f"https://github.com/owner/repo/commit/commit{i:03d}",
-            }
+def _make_commit(i):
+    return {
+        "sha": f"commit{i:03d}",
+        "commit": {
+            "message": f"commit {i}",
+            "author": {
+                "name": "Dev",
+                "email": "dev@test.com",
+                "date": "2025-01-15T10:00:00Z",
+            },
+        },
+        "author": {"login": "dev"},
+        "html_url": f"https://github.com/owner/repo/commit/commit{i:03d}",
+    }
+
 
-        page1 = [_make_commit(i) for i in range(100)]
-        page2 = [_make_commit(i) for i in range(100, 150)]
+# Commit pages for the pagination tests, encoded once at import.
+_FULL_PAGE = json.dumps([_make_commit(i) for i in range(100)]).encode()
+_PARTIAL_PAGE = json.dumps([_make_commit(i) for i in range(100, 150)]).encode()
+_SINGLE_COMMIT_PAGE = json.dumps([_make_commit(0)]).encode()
 
-        route = respx.get("https://api.github.com/repos/owner/repo/commits")
+
+class TestPagination:
+    async def test_paginate_multiple_pages(self, github_fetcher, api):
+        """Test that pagination fetches multiple pages."""
+        route = api.get(_COMMITS)
         route.side_effect = [
-            httpx.Response(200, json=page1),
-            httpx.Response(200, json=page2),
+            json_response(_FULL_PAGE),
+            json_response(_PARTIAL_PAGE),
         ]
 
         since = datetime(2025, 1, 1, tzinfo=timezone.utc)
         until = datetime(2025, 2, 1, tzinfo=timezone.utc)
         commits = await github_fetcher.fetch_commits("owner", "repo", since, until)
-        await github_fetcher.close()
 
         # Should have fetched all 150 commits across 2 pages
         assert len(commits) == 150
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_paginate_stops_on_empty(self, github_fetcher):
+    async def test_paginate_stops_on_empty(self, github_fetcher, api):
         """Test that pagination stops on empty page."""
-        page1 = [{"sha": "c1", "commit": {"message": "m", "author": {"name": "A", "email": "a@b.c", "date": "2025-01-15T00:00:00Z"}}, "author": {"login": "a"}, "html_url": "https://x.com/c"}]
-
-        route = respx.get("https://api.github.com/repos/owner/repo/commits")
+        route = api.get(_COMMITS)
         route.side_effect = [
-            httpx.Response(200, json=page1),
-            httpx.Response(200, json=[]),
+            json_response(_SINGLE_COMMIT_PAGE),
+            json_response(b"[]"),
         ]
 
         since = datetime(2025, 1, 1, tzinfo=timezone.utc)
         until = datetime(2025, 2, 1, tzinfo=timezone.utc)
         commits = await github_fetcher.fetch_commits("owner", "repo", since, until)
-        await github_fetcher.close()
 
         assert len(commits) == 1
 
 
 class TestClientLifecycle:
-    @pytest.mark.asyncio
-    async def test_close_without_client(self):
+    def test_client_built_eagerly(self):
+        fetcher = GitHubFetcher(token="test")
+        assert fetcher._client is not None
+
+    async def test_close_twice(self):
         fetcher = GitHubFetcher()
-        await fetcher.close()  # should not raise
+        await fetcher.close()
+        await fetcher.close()  # client already gone; should not raise
+        assert fetcher._client is None
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_close_after_use(self, github_fetcher):
-        respx.get("https://api.github.com/repos/owner/repo").mock(
-            return_value=httpx.Response(200, json={"name": "repo"})
-        )
+    async def test_close_after_use(self, github_fetcher, api):
+        api.get(_REPO).mock(return_value=json_response(_REPO_INFO_BODY))
         await github_fetcher.fetch_repo_info("owner", "repo")
         await github_fetcher.close()
         assert github_fetcher._client is None
@@ -1,27 +1,35 @@
 """Tests for analysis/functional.py — functional area analysis."""
 
 from pathlib import PurePosixPath
-from unittest.mock import MagicMock
 
-from repo_inspector.analysis.functional import build_functional_areas, gather_code_samples
+from repo_inspector.analysis.functional import (
+    build_functional_areas,
+    gather_code_samples,
+)
+
+_TWENTY_FILES = tuple(PurePosixPath(f"src/file{i}.py") for i in range(20))
+
+
+def _sample_headers(samples: str) -> list[str]:
+    return [line for line in samples.splitlines() if line.startswith("--- ")]
 
 
 class TestBuildFunctionalAreas:
-    def test_creates_areas_for_each_dir(self):
-        cloner = MagicMock()
-        cloner.list_top_level_dirs.return_value = ["src", "docs"]
-        cloner.folder_stats.side_effect = [
-            {"files": 10, "lines": 500},
-            {"files": 3, "lines": 100},
-        ]
-        cloner.detect_languages.side_effect = [
-            ["Python", "JavaScript"],
-            ["Markdown"],
-        ]
-        cloner.list_files_in_dir.side_effect = [
-            [PurePosixPath("src/main.py"), PurePosixPath("src/utils.py")],
-            [PurePosixPath("docs/guide.md")],
-        ]
+    def test_creates_areas_for_each_dir(self, fake_cloner):
+        cloner = fake_cloner(
+            stats={
+                "src": {"files": 10, "lines": 500},
+                "docs": {"files": 3, "lines": 100},
+            },
+            langs={
+                "src": ["Python", "JavaScript"],
+                "docs": ["Markdown"],
+            },
+            files={
+                "src": [PurePosixPath("src/main.py"), PurePosixPath("src/utils.py")],
+                "docs": [PurePosixPath("docs/guide.md")],
+            },
+        )
 
         areas = build_functional_areas(cloner)
 
@@ -32,20 +40,19 @@ class TestBuildFunctionalAreas:
         assert "500 lines" in areas[0].description
         assert "Python" in areas[0].description
         assert len(areas[0].key_files) == 2
+        assert areas[1].key_files == ["docs/guide.md"]
 
-    def test_empty_repo(self):
-        cloner = MagicMock()
-        cloner.list_top_level_dirs.return_value = []
+    def test_empty_repo(self, fake_cloner):
+        cloner = fake_cloner()
 
         areas = build_functional_areas(cloner)
         assert areas == []
 
-    def test_no_languages_detected(self):
-        cloner = MagicMock()
-        cloner.list_top_level_dirs.return_value = ["data"]
-        cloner.folder_stats.return_value = {"files": 1, "lines": 10}
-        cloner.detect_languages.return_value = []
-        cloner.list_files_in_dir.return_value = []
+    def test_no_languages_detected(self, fake_cloner):
+        cloner = fake_cloner(
+            stats={"data": {"files": 1, "lines": 10}},
+            langs={"data": []},
+        )
 
         areas = build_functional_areas(cloner)
         assert len(areas) == 1
@@ -53,16 +60,14 @@ class TestBuildFunctionalAreas:
 
 
 class TestGatherCodeSamples:
-    def test_gathers_code_files(self):
-        cloner = MagicMock()
-        cloner.list_files_in_dir.return_value = [
-            PurePosixPath("src/main.py"),
-            PurePosixPath("src/utils.py"),
-        ]
-        cloner.read_file.side_effect = [
-            "def main():\n    pass",
-            "def helper():\n    return 42",
-        ]
+    def test_gathers_code_files(self, fake_cloner):
+        cloner = fake_cloner(
+            files={"src": [PurePosixPath("src/main.py"), PurePosixPath("src/utils.py")]},
+            bodies={
+                "src/main.py": "def main():\n    pass",
+                "src/utils.py": "def helper():\n    return 42",
+            },
+        )
 
         result = gather_code_samples(cloner, "src")
 
@@ -70,34 +75,51 @@ class TestGatherCodeSamples:
         assert "utils.py" in result
         assert "def main" in result
 
-    def test_skips_empty_files(self):
-        cloner = MagicMock()
-        cloner.list_files_in_dir.return_value = [
-            PurePosixPath("src/empty.py"),
-            PurePosixPath("src/real.py"),
-        ]
-        cloner.read_file.side_effect = ["", "print('hello')"]
+    def test_lists_code_extensions_only(self, fake_cloner):
+        cloner = fake_cloner()
+
+        gather_code_samples(cloner, "src")
+
+        [(subdir, extensions)] = cloner.listings
+        assert subdir == "src"
+        assert {".py", ".ts", ".go"} <= extensions
+        assert not {".md", ".json", ".txt"} & extensions
+
+    def test_skips_empty_files(self, fake_cloner):
+        cloner = fake_cloner(
+            files={"src": [PurePosixPath("src/empty.py"), PurePosixPath("src/real.py")]},
+            bodies={"src/empty.py": "", "src/real.py": "print('hello')"},
+        )
 
         result = gather_code_samples(cloner, "src")
 
         assert "empty.py" not in result
         assert "real.py" in result
 
-    def test_limits_files(self):
-        cloner = MagicMock()
-        cloner.list_files_in_dir.return_value = [
-            PurePosixPath(f"src/file{i}.py") for i in range(20)
-        ]
-        cloner.read_file.return_value = "x = 1"
+    def test_limits_files(self, fake_cloner):
+        cloner = fake_cloner(
+            files={"src": _TWENTY_FILES},
+            bodies=dict.fromkeys(map(str, _TWENTY_FILES), "x = 1"),
+        )
 
         result = gather_code_samples(cloner, "src", max_files=3)
 
-        # Should only read 3 files
-        assert cloner.read_file.call_count == 3
+        # Should only read and include 3 files
+        assert [relpath for relpath, _ in cloner.reads] == [f"src/file{i}.py" for i in range(3)]
+        assert _sample_headers(result) == [f"--- src/file{i}.py ---" for i in range(3)]
+
+    def test_passes_line_limit_to_cloner(self, fake_cloner):
+        cloner = fake_cloner(
+            files={"src": [PurePosixPath("src/long.py")]},
+            bodies={"src/long.py": "line0\nline1"},
+        )
+
+        gather_code_samples(cloner, "src", max_lines_per_file=2)
+
+        assert cloner.reads == [("src/long.py", 2)]
 
-    def test_no_files(self):
-        cloner = MagicMock()
-        cloner.list_files_in_dir.return_value = []
+    def test_no_files(self, fake_cloner):
+        cloner = fake_cloner()
 
         result = gather_code_samples(cloner, "src")
         assert result == ""
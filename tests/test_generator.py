@@ -8,11 +8,11 @@ from repo_inspector.analysis.people import compute_bus_factor, compute_contribut
 from repo_inspector.models import Commit, ContributorStats, Issue, PullRequest
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_commits():
     base = datetime(2025, 1, 15, tzinfo=timezone.utc)
-    return [
-        Commit(
+    return (
+        Commit.model_construct(
             sha="aaa111",
             message="feat: add auth",
             author_name="Alice",
@@ -24,7 +24,7 @@ def sample_commits():
             deletions=10,
             files_changed=["src/auth.py", "src/models.py"],
         ),
-        Commit(
+        Commit.model_construct(
             sha="bbb222",
             message="fix: login bug",
             author_name="Bob",
@@ -35,7 +35,7 @@ def sample_commits():
             deletions=5,
             files_changed=["src/auth.py"],
         ),
-        Commit(
+        Commit.model_construct(
             sha="ccc333",
             message="docs: update readme",
             author_name="Alice",
@@ -46,13 +46,13 @@ def sample_commits():
             deletions=0,
             files_changed=["README.md"],
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_prs():
-    return [
-        PullRequest(
+    return (
+        PullRequest.model_construct(
             number=1,
             title="Add auth",
             author="alice",
@@ -60,20 +60,20 @@ def sample_prs():
             merged_at=datetime(2025, 1, 12, tzinfo=timezone.utc),
             url="https://github.com/o/r/pull/1",
         ),
-        PullRequest(
+        PullRequest.model_construct(
             number=2,
             title="Fix login",
             author="bob",
             created_at=datetime(2025, 1, 11, tzinfo=timezone.utc),
             url="https://github.com/o/r/pull/2",
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_issues():
-    return [
-        Issue(
+    return (
+        Issue.model_construct(
             number=10,
             title="Bug report",
             author="charlie",
@@ -81,63 +81,60 @@ def sample_issues():
             closed_at=datetime(2025, 1, 14, tzinfo=timezone.utc),
             url="https://github.com/o/r/issues/10",
         ),
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def computed_stats(sample_commits, sample_prs, sample_issues):
+    return compute_contributor_stats(sample_commits, sample_prs, sample_issues)
+
+
+@pytest.fixture(scope="module")
+def stats_by_login(computed_stats):
+    return {s.login: s for s in computed_stats}
 
 
 class TestComputeContributorStats:
-    def test_commit_counts(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        alice = next(s for s in stats if s.login == "alice")
-        assert alice.commit_count == 2
-        bob = next(s for s in stats if s.login == "bob")
-        assert bob.commit_count == 1
-
-    def test_lines_added(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        alice = next(s for s in stats if s.login == "alice")
+    def test_commit_counts(self, stats_by_login):
+        assert stats_by_login["alice"].commit_count == 2
+        assert stats_by_login["bob"].commit_count == 1
+
+    def test_lines_added(self, stats_by_login):
+        alice = stats_by_login["alice"]
         assert alice.lines_added == 230  # 200 + 30
 
-    def test_pr_counts(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        alice = next(s for s in stats if s.login == "alice")
+    def test_pr_counts(self, stats_by_login):
+        alice = stats_by_login["alice"]
         assert alice.prs_opened == 1
         assert alice.prs_merged == 1
 
-    def test_issue_counts(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        charlie = next(s for s in stats if s.login == "charlie")
+    def test_issue_counts(self, stats_by_login):
+        charlie = stats_by_login["charlie"]
         assert charlie.issues_opened == 1
         assert charlie.issues_closed == 1
 
-    def test_sorted_by_commit_count(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        assert stats[0].login == "alice"
+    def test_sorted_by_commit_count(self, computed_stats):
+        assert computed_stats[0].login == "alice"
 
-    def test_top_directories(self, sample_commits, sample_prs, sample_issues):
-        stats = compute_contributor_stats(sample_commits, sample_prs, sample_issues)
-        alice = next(s for s in stats if s.login == "alice")
+    def test_top_directories(self, stats_by_login):
+        alice = stats_by_login["alice"]
         assert "src" in alice.top_directories
 
 
+def _commit_counts(*counts):
+    """ContributorStats rows dev1..devN with the given commit counts, unvalidated."""
+    return [
+        ContributorStats.model_construct(login=f"dev{i}", commit_count=n)
+        for i, n in enumerate(counts, start=1)
+    ]
+
+
 class TestBusFactor:
-    def test_single_contributor(self):
-        stats = [ContributorStats(login="dev1", commit_count=100)]
-        assert compute_bus_factor(stats) == 1
-
-    def test_two_equal_contributors(self):
-        stats = [
-            ContributorStats(login="dev1", commit_count=50),
-            ContributorStats(login="dev2", commit_count=50),
-        ]
-        assert compute_bus_factor(stats) == 2  # need both to reach 80%
-
-    def test_no_commits(self):
-        assert compute_bus_factor([]) == 0
-
-    def test_uneven_distribution(self):
-        stats = [
-            ContributorStats(login="dev1", commit_count=90),
-            ContributorStats(login="dev2", commit_count=5),
-            ContributorStats(login="dev3", commit_count=5),
-        ]
-        assert compute_bus_factor(stats) == 1  # dev1 covers 90%
+    @pytest.mark.parametrize("counts,expected", [
+        ((100,), 1),
+        ((50, 50), 2),  # need both to reach 80%
+        ((), 0),
+        ((90, 5, 5), 1),  # dev1 covers 90%
+    ], ids=["single_contributor", "two_equal_contributors", "no_commits", "uneven_distribution"])
+    def test_bus_factor(self, counts, expected):
+        assert compute_bus_factor(_commit_counts(*counts)) == expected
@@ -0,0 +1,55 @@
+"""Tests for screens/loading.py — coalesced status updates."""
+
+from unittest.mock import patch
+
+from textual.app import App
+
+from repo_inspector.screens.loading import LoadingScreen
+
+
+class _ManualFlushScreen(LoadingScreen):
+    """Loading screen whose flush timer never fires, so tests drive the ticks."""
+
+    FLUSH_INTERVAL = 3600
+
+
+class _LoadingApp(App):
+    def on_mount(self) -> None:
+        self.push_screen(_ManualFlushScreen())
+
+
+class TestStatusCoalescing:
+    async def test_updates_within_one_interval_paint_once(self):
+        async with _LoadingApp().run_test() as pilot:
+            screen = pilot.app.screen
+            label = screen._status_label
+            with patch.object(label, "update", wraps=label.update) as label_update:
+                screen.update_status("Fetching commits …", 10)
+                screen.update_status("Fetching PRs …", 20)
+                screen.update_status("Fetching issues …", 30)
+                label_update.assert_not_called()
+
+                screen._flush_status()
+                label_update.assert_called_once_with("Fetching issues …")
+
+    async def test_last_tick_flushes_final_message_and_progress(self):
+        async with _LoadingApp().run_test() as pilot:
+            screen = pilot.app.screen
+            screen.update_status("Analyzing code …", 80)
+            screen.update_status("Complete!", 100)
+            screen._flush_status()
+            await pilot.pause()
+
+            assert str(screen._status_label.render()) == "Complete!"
+            assert screen._progress_bar.progress == 100
+
+    async def test_idle_tick_does_not_repaint(self):
+        async with _LoadingApp().run_test() as pilot:
+            screen = pilot.app.screen
+            screen.update_status("Cloning …", 5)
+            screen._flush_status()
+            label = screen._status_label
+            with patch.object(label, "update") as label_update:
+                screen._flush_status()
+                label_update.assert_not_called()
+            assert screen._progress_bar.progress == 5
@@ -17,72 +17,75 @@ from repo_inspector.models import (
     Timeframe,
 )
 
+# A fixed "now" keeps these tests deterministic and avoids a clock read per test.
+_FIXED_NOW = datetime(2025, 1, 15, tzinfo=timezone.utc)
+_SINCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_UNTIL = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
 
 class TestTimeframe:
     def test_label_format(self):
-        tf = Timeframe(
-            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            until=datetime(2025, 2, 1, tzinfo=timezone.utc),
-        )
+        tf = Timeframe(since=_SINCE, until=_UNTIL)
         assert "2025-01-01" in tf.label
         assert "2025-02-01" in tf.label
 
 
-class TestCommit:
-    def test_create_commit(self):
-        c = Commit(
-            sha="abc123def456",
-            message="feat: new feature",
-            author_name="Dev",
-            date=datetime.now(timezone.utc),
-            url="https://github.com/owner/repo/commit/abc123def456",
-        )
-        assert c.sha == "abc123def456"
-        assert c.short_sha == "abc123d"
-
-    def test_short_sha_auto_generated(self):
-        c = Commit(
-            sha="1234567890abcdef",
-            message="test",
-            author_name="Dev",
-            date=datetime.now(timezone.utc),
-            url="https://github.com/x/y/commit/1234567890abcdef",
+class TestModelConstruction:
+    @pytest.mark.parametrize("cls,kwargs,expected", [
+        (Commit, {
+            "sha": "abc123def456",
+            "message": "feat: new feature",
+            "author_name": "Dev",
+            "date": _FIXED_NOW,
+            "url": "https://github.com/owner/repo/commit/abc123def456",
+        }, {"sha": "abc123def456", "short_sha": "abc123d"}),
+        (Commit, {
+            "sha": "1234567890abcdef",
+            "message": "test",
+            "author_name": "Dev",
+            "date": _FIXED_NOW,
+            "url": "https://github.com/x/y/commit/1234567890abcdef",
+        }, {"short_sha": "1234567"}),
+        (PullRequest, {
+            "number": 42,
+            "title": "Add feature",
+            "author": "dev1",
+            "created_at": _FIXED_NOW,
+            "url": "https://github.com/owner/repo/pull/42",
+        }, {"number": 42, "labels": [], "merged_at": None}),
+        (Issue, {
+            "number": 10,
+            "title": "Bug report",
+            "author": "reporter",
+            "created_at": _FIXED_NOW,
+            "url": "https://github.com/owner/repo/issues/10",
+        }, {"state": "open"}),
+        (ContributorStats, {"login": "dev1"},
+         {"commit_count": 0, "files_touched": [], "top_directories": []}),
+    ], ids=["commit", "short_sha_auto_generated", "pull_request", "issue", "contributor_defaults"])
+    def test_model_construction(self, cls, kwargs, expected):
+        model = cls(**kwargs)
+        assert {attr: getattr(model, attr) for attr in expected} == expected
+
+
+class TestPeopleReport:
+    def test_total_commits(self):
+        report = PeopleReport(stats=[
+            ContributorStats(login="a", commit_count=3),
+            ContributorStats(login="b", commit_count=4),
+        ])
+        assert report.total_commits == 7
+        assert report.model_dump()["total_commits"] == 7
+
+    def test_total_commits_follows_copied_stats(self):
+        report = PeopleReport(stats=[ContributorStats(login="a", commit_count=3)])
+        copy = report.model_copy(
+            update={"stats": [ContributorStats(login="b", commit_count=9)]}
         )
-        assert c.short_sha == "1234567"
+        assert (report.total_commits, copy.total_commits) == (3, 9)
 
-
-class TestPullRequest:
-    def test_create_pr(self):
-        pr = PullRequest(
-            number=42,
-            title="Add feature",
-            author="dev1",
-            created_at=datetime.now(timezone.utc),
-            url="https://github.com/owner/repo/pull/42",
-        )
-        assert pr.number == 42
-        assert pr.labels == []
-        assert pr.merged_at is None
-
-
-class TestIssue:
-    def test_create_issue(self):
-        issue = Issue(
-            number=10,
-            title="Bug report",
-            author="reporter",
-            created_at=datetime.now(timezone.utc),
-            url="https://github.com/owner/repo/issues/10",
-        )
-        assert issue.state == "open"
-
-
-class TestContributorStats:
-    def test_defaults(self):
-        cs = ContributorStats(login="dev1")
-        assert cs.commit_count == 0
-        assert cs.files_touched == []
-        assert cs.top_directories == []
+    def test_total_commits_empty(self):
+        assert PeopleReport().total_commits == 0
 
 
 class TestCodeFinding:
@@ -124,10 +127,7 @@ class TestFolderAnalysis:
 
 class TestInspectionResult:
     def test_create_result(self):
-        tf = Timeframe(
-            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            until=datetime(2025, 2, 1, tzinfo=timezone.utc),
-        )
+        tf = Timeframe(since=_SINCE, until=_UNTIL)
         result = InspectionResult(repo="owner/repo", timeframe=tf)
         assert result.repo == "owner/repo"
         assert result.people.total_contributors == 0
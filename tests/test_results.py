@@ -0,0 +1,160 @@
+"""Tests for screens/results.py — lazily built tabs and paged tables."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from textual.app import App
+from textual.widgets import Button, DataTable, TabbedContent, TabPane
+
+from repo_inspector.models import (
+    DependencyInfo,
+    DependencyReport,
+    ExtendedResult,
+    InspectionResult,
+    StaleBranch,
+    StaleBranchReport,
+    Timeframe,
+)
+from repo_inspector.screens.results import ResultsScreen, _TabBody
+
+
+def _result(n_deps: int = 3, n_stale: int = 3) -> InspectionResult:
+    return InspectionResult(
+        repo="octo/widgets",
+        timeframe=Timeframe(since=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        extended=ExtendedResult(
+            dependencies=DependencyReport(
+                dependencies=[DependencyInfo(name=f"pkg{i}") for i in range(n_deps)],
+                total_deps=n_deps,
+            ),
+            stale_branches=StaleBranchReport(
+                stale_branches=[StaleBranch(name=f"b{i}") for i in range(n_stale)],
+                total_branches=n_stale,
+            ),
+        ),
+    )
+
+
+class _ResultsApp(App):
+    def __init__(self, result: InspectionResult) -> None:
+        super().__init__()
+        self._result = result
+
+    def on_mount(self) -> None:
+        self.push_screen(ResultsScreen(self._result))
+
+
+def _built_tabs(screen: ResultsScreen) -> set[str | None]:
+    return {pane.id for pane in screen.query(TabPane) if pane.query(_TabBody)}
+
+
+class TestLazyTabs:
+    async def test_only_active_tab_is_built(self):
+        async with _ResultsApp(_result()).run_test() as pilot:
+            await pilot.pause()
+            screen = pilot.app.screen
+            assert _built_tabs(screen) == {"people"}
+
+            screen.query_one(TabbedContent).active = "dependencies"
+            await pilot.pause()
+            assert _built_tabs(screen) == {"people", "dependencies"}
+
+    async def test_missing_extended_reports_get_no_tab(self):
+        result = _result()
+        result.extended = None
+        async with _ResultsApp(result).run_test() as pilot:
+            await pilot.pause()
+            pane_ids = {pane.id for pane in pilot.app.screen.query(TabPane)}
+            assert pane_ids == {"people", "functional", "code"}
+
+    async def test_revisited_tab_is_composed_once(self):
+        async with _ResultsApp(_result()).run_test() as pilot:
+            await pilot.pause()
+            screen = pilot.app.screen
+            tabs = screen.query_one(TabbedContent)
+            with patch.object(
+                screen, "_compose_dependencies", wraps=screen._compose_dependencies
+            ) as compose:
+                for tab_id in ("dependencies", "people", "dependencies"):
+                    tabs.active = tab_id
+                    await pilot.pause()
+                compose.assert_called_once()
+            pane = screen.query_one("#dependencies", TabPane)
+            assert len(pane.query(_TabBody)) == 1
+
+
+async def _open_tab(pilot, tab_id: str) -> ResultsScreen:
+    """Activate *tab_id* and wait for its table to finish streaming."""
+    await pilot.pause()
+    screen = pilot.app.screen
+    screen.query_one(TabbedContent).active = tab_id
+    await pilot.pause()
+    await pilot.app.workers.wait_for_complete()
+    return screen
+
+
+async def _load_more(pilot, button: Button) -> None:
+    button.press()
+    await pilot.pause()
+    await pilot.app.workers.wait_for_complete()
+
+
+class TestLoadMore:
+    async def test_each_press_adds_one_page(self):
+        async with _ResultsApp(_result(n_deps=120)).run_test() as pilot:
+            screen = await _open_tab(pilot, "dependencies")
+            table = screen.query_one("#deps-table", DataTable)
+            button = screen.query_one("#deps-more", Button)
+            assert table.row_count == ResultsScreen.VISIBLE_ROWS
+
+            await _load_more(pilot, button)
+            assert table.row_count == 2 * ResultsScreen.VISIBLE_ROWS
+            assert button.display
+
+    async def test_button_hides_after_last_page(self):
+        async with _ResultsApp(_result(n_stale=120)).run_test() as pilot:
+            screen = await _open_tab(pilot, "stale_branches")
+            table = screen.query_one("#stale-table", DataTable)
+            button = screen.query_one("#stale-more", Button)
+
+            await _load_more(pilot, button)
+            await _load_more(pilot, button)
+            assert table.row_count == 120
+            assert not button.display
+
+    async def test_no_button_when_everything_fits(self):
+        async with _ResultsApp(_result(n_deps=30)).run_test() as pilot:
+            screen = await _open_tab(pilot, "dependencies")
+            assert screen.query_one("#deps-table", DataTable).row_count == 30
+            assert not screen.query("#deps-more")
+
+
+class TestRowStreaming:
+    async def test_first_paint_then_stream_to_page_end(self):
+        async with _ResultsApp(_result(n_deps=120)).run_test() as pilot:
+            await pilot.pause()
+            screen = pilot.app.screen
+            with patch.object(screen, "_start_pending_streams"):
+                screen.query_one(TabbedContent).active = "dependencies"
+                await pilot.pause()
+            table = screen.query_one("#deps-table", DataTable)
+            button = screen.query_one("#deps-more", Button)
+            assert table.row_count == ResultsScreen.FIRST_PAINT_ROWS
+
+            screen._start_pending_streams()
+            assert button.disabled
+            await pilot.app.workers.wait_for_complete()
+            assert table.row_count == ResultsScreen.VISIBLE_ROWS
+            assert not button.disabled
+
+    async def test_load_more_ignores_missing_report(self):
+        async with _ResultsApp(_result(n_deps=120)).run_test() as pilot:
+            screen = await _open_tab(pilot, "dependencies")
+            table = screen.query_one("#deps-table", DataTable)
+            button = screen.query_one("#deps-more", Button)
+            screen.result.extended = None
+
+            screen._load_more_dependencies(Button.Pressed(button))
+            screen._load_more_stale_branches(Button.Pressed(button))
+            await pilot.app.workers.wait_for_complete()
+            assert table.row_count == ResultsScreen.VISIBLE_ROWS
@@ -1,16 +1,19 @@
 """Tests for the stale branches analysis module."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from repo_inspector.analysis.stale_branches import build_stale_branch_report
 
+# build_stale_branch_report measures age against the real clock, so anchor the
+# fake branches to it too, but read it only once per run.
+_NOW = datetime.now(timezone.utc)
+
 
 def _make_branch(name: str, days_ago: int, author: str = "dev") -> dict:
     """Helper to create a branch dict."""
-    from datetime import timedelta
-    date = (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+    date = (_NOW - timedelta(days=days_ago)).isoformat()
     return {
         "name": name,
         "commit": {
@@ -26,34 +29,25 @@ class TestBuildStaleBranchReport:
     def test_excludes_default_branch(self):
         branches = [_make_branch("main", 1), _make_branch("old-feature", 100)]
         report = build_stale_branch_report(branches, "main", {})
-        names = [b.name for b in report.stale_branches]
-        assert "main" not in names
-
-    def test_detects_stale_branches(self):
-        branches = [
-            _make_branch("main", 1),
-            _make_branch("feature/old", 90),
-            _make_branch("feature/recent", 10),
-        ]
+        assert not any(b.name == "main" for b in report.stale_branches)
+
+    @pytest.mark.parametrize("branch_specs,expected", [
+        ((("main", 1), ("feature/old", 90), ("feature/recent", 10)), ["feature/old"]),
+        ((("main", 1), ("dev", 5)), []),
+    ], ids=["detects_stale_branches", "no_stale_branches"])
+    def test_stale_branch_names(self, branch_specs, expected):
+        branches = [_make_branch(name, days) for name, days in branch_specs]
         report = build_stale_branch_report(branches, "main", {}, stale_threshold_days=60)
-        assert len(report.stale_branches) == 1
-        assert report.stale_branches[0].name == "feature/old"
-
-    def test_categorizes_wip(self):
-        branches = [_make_branch("wip-experiment", 100)]
-        report = build_stale_branch_report(branches, "main", {})
-        assert report.stale_branches[0].category == "wip"
-
-    def test_categorizes_feature(self):
-        branches = [_make_branch("feature/login", 100)]
-        report = build_stale_branch_report(branches, "main", {})
-        assert report.stale_branches[0].category == "stale-feature"
+        assert [b.name for b in report.stale_branches] == expected
 
-    def test_categorizes_orphan(self):
-        branches = [_make_branch("some-branch", 100)]
-        compare = {"some-branch": {"ahead_by": 0, "behind_by": 15}}
-        report = build_stale_branch_report(branches, "main", compare)
-        assert report.stale_branches[0].category == "orphan"
+    @pytest.mark.parametrize("name,compare,expected", [
+        ("wip-experiment", {}, "wip"),
+        ("feature/login", {}, "stale-feature"),
+        ("some-branch", {"some-branch": {"ahead_by": 0, "behind_by": 15}}, "orphan"),
+    ], ids=["wip", "feature", "orphan"])
+    def test_categorizes(self, name, compare, expected):
+        report = build_stale_branch_report([_make_branch(name, 100)], "main", compare)
+        assert report.stale_branches[0].category == expected
 
     def test_total_branches_count(self):
         branches = [
@@ -84,11 +78,6 @@ class TestBuildStaleBranchReport:
         days = [b.days_stale for b in report.stale_branches]
         assert days == sorted(days, reverse=True)
 
-    def test_no_stale_branches(self):
-        branches = [_make_branch("main", 1), _make_branch("dev", 5)]
-        report = build_stale_branch_report(branches, "main", {})
-        assert len(report.stale_branches) == 0
-
     def test_ahead_behind_info(self):
         branches = [_make_branch("old", 100)]
         compare = {"old": {"ahead_by": 3, "behind_by": 12}}
@@ -8,7 +8,7 @@ from repo_inspector.analysis.time_machine import build_time_comparison
 from repo_inspector.models import ContributorStats, Timeframe
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def old_tf():
     return Timeframe(
         since=datetime(2024, 12, 1, tzinfo=timezone.utc),
@@ -16,7 +16,7 @@ def old_tf():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def new_tf():
     return Timeframe(
         since=datetime(2025, 1, 1, tzinfo=timezone.utc),
@@ -24,11 +24,16 @@ def new_tf():
     )
 
 
+@pytest.fixture(scope="module")
+def empty_comparison_report(old_tf, new_tf):
+    return build_time_comparison([], [], old_tf, new_tf, 0, 0, 0, 0)
+
+
 class TestBuildTimeComparison:
-    def test_detects_new_contributors(self, old_tf, new_tf):
-        old_stats = [ContributorStats(login="alice", commit_count=10)]
+    def test_detects_new_contributors(self, old_tf, new_tf, alice_stats):
+        old_stats = [alice_stats]
         new_stats = [
-            ContributorStats(login="alice", commit_count=10),
+            alice_stats,
             ContributorStats(login="bob", commit_count=5),
         ]
         report = build_time_comparison(
@@ -36,9 +41,9 @@ class TestBuildTimeComparison:
         )
         assert "bob" in report.contributor_churn
 
-    def test_detects_departed_contributors(self, old_tf, new_tf):
+    def test_detects_departed_contributors(self, old_tf, new_tf, alice_stats):
         old_stats = [
-            ContributorStats(login="alice", commit_count=10),
+            alice_stats,
             ContributorStats(login="charlie", commit_count=3),
         ]
         new_stats = [ContributorStats(login="alice", commit_count=12)]
@@ -79,16 +84,11 @@ class TestBuildTimeComparison:
         finding_delta = next(d for d in report.deltas if d.metric == "Code Findings")
         assert finding_delta.change == "+7"
 
-    def test_timeframes_stored(self, old_tf, new_tf):
-        report = build_time_comparison([], [], old_tf, new_tf, 0, 0, 0, 0)
-        assert report.old_timeframe == old_tf
-        assert report.new_timeframe == new_tf
-
-    def test_all_deltas_present(self, old_tf, new_tf):
-        report = build_time_comparison([], [], old_tf, new_tf, 0, 0, 0, 0)
-        metric_names = {d.metric for d in report.deltas}
-        assert "Commit Volume" in metric_names
-        assert "Contributors" in metric_names
-        assert "Bus Factor" in metric_names
-        assert "Lines Changed" in metric_names
-        assert "Code Findings" in metric_names
+    def test_timeframes_stored(self, empty_comparison_report, old_tf, new_tf):
+        assert empty_comparison_report.old_timeframe == old_tf
+        assert empty_comparison_report.new_timeframe == new_tf
+
+    def test_all_deltas_present(self, empty_comparison_report):
+        assert {d.metric for d in empty_comparison_report.deltas} >= {
+            "Commit Volume", "Contributors", "Bus Factor", "Lines Changed", "Code Findings",
+        }
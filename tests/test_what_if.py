@@ -9,120 +9,129 @@ from repo_inspector.analysis.what_if import (
     simulate_deprecate_module,
     simulate_remove_contributor,
 )
-from repo_inspector.models import Commit, ContributorStats, Issue, PullRequest
+from repo_inspector.models import Commit, ContributorStats, PullRequest
+
+_BASE = datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+_WI_COMMITS = (
+    Commit.model_construct(
+        sha="a1", message="auth work", author_name="Alice",
+        author_login="alice", date=_BASE,
+        url="https://github.com/o/r/commit/a1",
+        files_changed=["src/auth.py", "src/session.py"],
+    ),
+    Commit.model_construct(
+        sha="a2", message="more auth", author_name="Alice",
+        author_login="alice", date=_BASE,
+        url="https://github.com/o/r/commit/a2",
+        files_changed=["src/auth.py", "tests/test_auth.py"],
+    ),
+    Commit.model_construct(
+        sha="b1", message="api work", author_name="Bob",
+        author_login="bob", date=_BASE,
+        url="https://github.com/o/r/commit/b1",
+        files_changed=["src/api.py", "src/auth.py"],
+    ),
+)
+
+_WI_PRS = (
+    PullRequest.model_construct(
+        number=1, title="Auth PR", author="alice",
+        created_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        url="https://github.com/o/r/pull/1",
+    ),
+)
+
+_WI_STATS = (
+    ContributorStats.model_construct(login="alice", commit_count=2),
+    ContributorStats.model_construct(login="bob", commit_count=1),
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wi_commits():
-    base = datetime(2025, 1, 15, tzinfo=timezone.utc)
-    return [
-        Commit(
-            sha="a1", message="auth work", author_name="Alice",
-            author_login="alice", date=base,
-            url="https://github.com/o/r/commit/a1",
-            files_changed=["src/auth.py", "src/session.py"],
-        ),
-        Commit(
-            sha="a2", message="more auth", author_name="Alice",
-            author_login="alice", date=base,
-            url="https://github.com/o/r/commit/a2",
-            files_changed=["src/auth.py", "tests/test_auth.py"],
-        ),
-        Commit(
-            sha="b1", message="api work", author_name="Bob",
-            author_login="bob", date=base,
-            url="https://github.com/o/r/commit/b1",
-            files_changed=["src/api.py", "src/auth.py"],
-        ),
-    ]
-
-
-@pytest.fixture
+    return _WI_COMMITS
+
+
+@pytest.fixture(scope="module")
 def wi_prs():
-    return [
-        PullRequest(
-            number=1, title="Auth PR", author="alice",
-            created_at=datetime(2025, 1, 10, tzinfo=timezone.utc),
-            url="https://github.com/o/r/pull/1",
-        ),
-    ]
+    return _WI_PRS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wi_issues():
-    return []
+    return ()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wi_stats():
-    return [
-        ContributorStats(login="alice", commit_count=2),
-        ContributorStats(login="bob", commit_count=1),
-    ]
+    return _WI_STATS
+
+
+@pytest.fixture(scope="module")
+def remove_alice_result(wi_commits, wi_prs, wi_issues):
+    return simulate_remove_contributor("alice", wi_commits, wi_prs, wi_issues, 2)
+
+
+@pytest.fixture(scope="module")
+def alice_orphaned(remove_alice_result):
+    return frozenset(remove_alice_result.orphaned_files)
+
+
+@pytest.fixture(scope="module")
+def deprecate_src_result(wi_commits):
+    return simulate_deprecate_module("src", wi_commits)
+
+
+@pytest.fixture(scope="module")
+def src_orphaned(deprecate_src_result):
+    return tuple(f for f in deprecate_src_result.orphaned_files if f.startswith("src/"))
+
+
+@pytest.fixture(scope="module")
+def what_if_report(wi_stats, wi_commits, wi_prs, wi_issues):
+    return build_what_if_report(
+        wi_stats, wi_commits, wi_prs, wi_issues, bus_factor=2, top_dirs=["src"]
+    )
 
 
 class TestSimulateRemoveContributor:
-    def test_orphaned_files(self, wi_commits, wi_prs, wi_issues):
-        result = simulate_remove_contributor(
-            "alice", wi_commits, wi_prs, wi_issues, 2
-        )
+    def test_orphaned_files(self, alice_orphaned):
         # src/session.py and tests/test_auth.py are only touched by alice
-        assert "src/session.py" in result.orphaned_files
-        assert "tests/test_auth.py" in result.orphaned_files
+        assert {"src/session.py", "tests/test_auth.py"} <= alice_orphaned
 
-    def test_shared_files_not_orphaned(self, wi_commits, wi_prs, wi_issues):
-        result = simulate_remove_contributor(
-            "alice", wi_commits, wi_prs, wi_issues, 2
-        )
+    def test_shared_files_not_orphaned(self, alice_orphaned):
         # src/auth.py is touched by both alice and bob
-        assert "src/auth.py" not in result.orphaned_files
+        assert "src/auth.py" not in alice_orphaned
 
-    def test_bus_factor_changes(self, wi_commits, wi_prs, wi_issues):
-        result = simulate_remove_contributor(
-            "alice", wi_commits, wi_prs, wi_issues, 2
-        )
-        assert result.bus_factor_before == 2
-        assert result.bus_factor_after >= 1
+    def test_bus_factor_changes(self, remove_alice_result):
+        assert remove_alice_result.bus_factor_before == 2
+        assert remove_alice_result.bus_factor_after >= 1
 
-    def test_scenario_metadata(self, wi_commits, wi_prs, wi_issues):
-        result = simulate_remove_contributor(
-            "alice", wi_commits, wi_prs, wi_issues, 2
-        )
-        assert result.scenario == "remove_contributor"
-        assert result.parameter == "alice"
+    def test_scenario_metadata(self, remove_alice_result):
+        assert remove_alice_result.scenario == "remove_contributor"
+        assert remove_alice_result.parameter == "alice"
 
 
 class TestSimulateDeprecateModule:
-    def test_finds_affected_files(self, wi_commits):
-        result = simulate_deprecate_module("src", wi_commits)
-        assert len(result.orphaned_files) > 0
-        assert any("src/" in f for f in result.orphaned_files)
+    def test_finds_affected_files(self, src_orphaned):
+        assert len(src_orphaned) > 0
 
-    def test_finds_affected_contributors(self, wi_commits):
-        result = simulate_deprecate_module("src", wi_commits)
-        assert "alice" in result.affected_areas
-        assert "bob" in result.affected_areas
+    def test_finds_affected_contributors(self, deprecate_src_result):
+        assert "alice" in deprecate_src_result.affected_areas
+        assert "bob" in deprecate_src_result.affected_areas
 
-    def test_scenario_metadata(self, wi_commits):
-        result = simulate_deprecate_module("src", wi_commits)
-        assert result.scenario == "deprecate_module"
-        assert result.parameter == "src"
+    def test_scenario_metadata(self, deprecate_src_result):
+        assert deprecate_src_result.scenario == "deprecate_module"
+        assert deprecate_src_result.parameter == "src"
 
 
 class TestBuildWhatIfReport:
-    def test_generates_scenarios(self, wi_stats, wi_commits, wi_prs, wi_issues):
-        report = build_what_if_report(
-            wi_stats, wi_commits, wi_prs, wi_issues, bus_factor=2, top_dirs=["src"]
-        )
-        scenarios = report.scenarios
+    def test_generates_scenarios(self, what_if_report):
         # Should have contributor removal + module deprecation scenarios
-        types = [s.scenario for s in scenarios]
-        assert "remove_contributor" in types
-        assert "deprecate_module" in types
-
-    def test_limits_to_top_contributors(self, wi_stats, wi_commits, wi_prs, wi_issues):
-        report = build_what_if_report(
-            wi_stats, wi_commits, wi_prs, wi_issues, bus_factor=2, top_dirs=["src"]
-        )
-        removals = [s for s in report.scenarios if s.scenario == "remove_contributor"]
+        types = {s.scenario for s in what_if_report.scenarios}
+        assert {"remove_contributor", "deprecate_module"} <= types
+
+    def test_limits_to_top_contributors(self, what_if_report):
+        removals = [s for s in what_if_report.scenarios if s.scenario == "remove_contributor"]
         assert len(removals) <= 3